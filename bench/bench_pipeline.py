@@ -0,0 +1,168 @@
+# ============================================================
+# CHASIDE • Benchmark del pipeline con datos sintéticos
+# ============================================================
+# Mide tiempo (mejor de R repeticiones), memoria pico (tracemalloc) y RSS
+# máximo del proceso de cada etapa para 1k, 10k, 100k y 1M estudiantes, y compara contra una
+# línea base guardada para detectar regresiones.
+#
+#   python bench/bench_pipeline.py                       # todas las escalas
+#   python bench/bench_pipeline.py --sizes 1000 10000 --save
+#   python bench/bench_pipeline.py --check               # exit 1 si hay regresión
+#
+# bench/baselines.json trae una línea base de referencia (1k–100k); en otra
+# máquina conviene regenerarla con --save antes de usar --check, que falla
+# si no hay línea base para alguna de las escalas medidas.
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chaside.cube import AggCube                 # noqa: E402
+from chaside.index import StudentIndex           # noqa: E402
+from chaside.io import read_answers              # noqa: E402
+from chaside.pipeline import process_chaside     # noqa: E402
+from chaside.report import career_report         # noqa: E402
+from chaside.synthetic import write_csv          # noqa: E402
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def _carrera_mayor(ctx):
+    ix = StudentIndex(ctx['df'], ctx['col_car'], ctx['col_nom'])
+    car = max(ix.carreras, key=ix.n_students)
+    return ctx['df'].iloc[ix.rows(car)], car
+
+
+# (nombre, función(ctx) → resultado, clave donde guardar el resultado)
+STAGES = [
+    ('load_csv',        lambda c: read_answers(c['path']),                        'raw'),
+    ('process_chaside', lambda c: process_chaside(c['raw']),                      'proc'),
+    ('agg_cube',        lambda c: AggCube.from_frame(c['df'], c['col_car']),      'cube'),
+    ('agg_pie',         lambda c: c['cube'].pie(),                                None),
+    ('agg_stacked',     lambda c: c['cube'].stacked(c['col_car'], pct=True),      None),
+    ('career_report',   lambda c: career_report(*c['carrera'], c['col_nom']),     None),
+]
+
+
+def _rss_max_mb():
+    """RSS máximo del proceso hasta ahora (incluye buffers de Arrow, que
+    tracemalloc no ve); None donde `resource` no existe (Windows)."""
+    if resource is None:
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(kb / (2**20 if sys.platform == 'darwin' else 2**10), 1)
+
+
+def medir(fn, ctx, repeticiones: int, memoria: bool):
+    """(resultado, segundos (mejor), pico MB o None)."""
+    mejor, res = float('inf'), None
+    for _ in range(repeticiones):
+        res = None
+        gc.collect()
+        t0 = time.perf_counter()
+        res = fn(ctx)
+        mejor = min(mejor, time.perf_counter() - t0)
+    pico = None
+    if memoria:
+        del res
+        gc.collect()
+        tracemalloc.start()
+        res = fn(ctx)
+        pico = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return res, mejor, pico
+
+
+def run_size(n: int, datadir: str, memoria: bool) -> dict:
+    path = os.path.join(datadir, f'chaside_{n}.csv')
+    if not os.path.exists(path):
+        print(f'  generando {path} …', file=sys.stderr)
+        write_csv(path, n, seed=n)
+    ctx = {'path': path}
+    rep = 5 if n <= 10_000 else (2 if n <= 100_000 else 1)
+    out = {}
+    for nombre, fn, clave in STAGES:
+        if nombre == 'career_report':
+            ctx['carrera'] = _carrera_mayor(ctx)
+        res, seg, pico = medir(fn, ctx, rep, memoria)
+        if clave == 'proc':
+            ctx['df'], ctx['col_car'], ctx['col_nom'] = res
+        elif clave:
+            ctx[clave] = res
+        rss = _rss_max_mb()
+        out[nombre] = {'s': round(seg, 5), 'peak_mb': None if pico is None else round(pico, 2),
+                       'rss_max_mb': rss}
+        mem = '' if pico is None else f'{pico:10.1f} MB'
+        print(f'  {nombre:<16}{seg*1000:12.1f} ms{mem}   (RSS máx. {rss} MB)')
+    return out
+
+
+def comparar(actual: dict, base: dict, tol_t: float, tol_m: float, piso_s: float = 0.02) -> list:
+    """Lista de regresiones (texto) respecto a la línea base."""
+    regs = []
+    for n, etapas in actual.items():
+        for etapa, v in etapas.items():
+            b = base.get(n, {}).get(etapa)
+            if not b:
+                continue
+            if v['s'] > piso_s and v['s'] > b['s'] * (1 + tol_t):
+                regs.append(f'{n} {etapa}: {b["s"]*1000:.1f} → {v["s"]*1000:.1f} ms')
+            if v['peak_mb'] and b.get('peak_mb') and v['peak_mb'] > b['peak_mb'] * (1 + tol_m):
+                regs.append(f'{n} {etapa}: {b["peak_mb"]:.1f} → {v["peak_mb"]:.1f} MB')
+    return regs
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='Benchmark del pipeline CHASIDE.')
+    ap.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    ap.add_argument('--datadir', default=os.path.join(AQUI, '.data'))
+    ap.add_argument('--baseline', default=os.path.join(AQUI, 'baselines.json'))
+    ap.add_argument('--save', action='store_true', help='guardar resultados como línea base')
+    ap.add_argument('--check', action='store_true', help='fallar (exit 1) si hay regresiones')
+    ap.add_argument('--no-mem', action='store_true', help='omitir la medición de memoria')
+    ap.add_argument('--tol-time', type=float, default=0.5, help='tolerancia de tiempo (default: +50%%)')
+    ap.add_argument('--tol-mem', type=float, default=0.25, help='tolerancia de memoria (default: +25%%)')
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.datadir, exist_ok=True)
+    resultados = {}
+    for n in args.sizes:
+        print(f'▶ {n:,} estudiantes')
+        resultados[str(n)] = run_size(n, args.datadir, not args.no_mem)
+
+    base = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as fh:
+            base = json.load(fh).get('resultados', {})
+    regs = comparar(resultados, base, args.tol_time, args.tol_mem)
+    for r in regs:
+        print(f'⚠ regresión: {r}')
+    sin_base = [n for n in resultados if n not in base]
+    if args.check and sin_base:
+        # sin línea base no hay nada contra qué comparar: no cuenta como aprobado
+        print(f'✖ sin línea base en {args.baseline} para: {", ".join(sin_base)} (usa --save)')
+
+    if args.save:
+        base.update(resultados)
+        with open(args.baseline, 'w', encoding='utf-8') as fh:
+            json.dump({'maquina': platform.platform(), 'python': platform.python_version(),
+                       'resultados': base}, fh, indent=2, ensure_ascii=False)
+        print(f'✔ línea base guardada en {args.baseline}')
+    return 1 if (args.check and (regs or sin_base)) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# ============================================================
+# CHASIDE • Arranque en frío y reruns por página (AppTest)
+# ============================================================
+# Cada página se mide en un proceso nuevo: la primera ejecución del script
+# (Presentación, arranque en frío), la primera apertura de la página
+# (imports diferidos + carga del dataset, con la caché de disco vacía) y la
+# mediana de R reruns posteriores. También lista qué módulos pesados
+# quedaron importados tras la página: las estáticas no deberían cargar
+# pandas, plotly ni el pipeline.
+#
+#   python bench/bench_startup.py                     # 20k filas sintéticas
+#   python bench/bench_startup.py --filas 100000 --reruns 10 --json arranque.json
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(os.path.dirname(AQUI), 'main.py')
+PAGINAS = ["Presentación", "Información general", "Información individual", "Equipo de trabajo"]
+# plotly.express y no plotly: Streamlit ya importa el paquete base para st.plotly_chart
+PESADOS = ['pandas', 'numpy', 'pyarrow', 'plotly.express', 'chaside.pipeline', 'chaside.dataset']
+
+
+def medir_pagina(pagina: str, datos: str, reruns: int) -> dict:
+    """Corre en el proceso hijo: tiempos de una página desde un intérprete limpio."""
+    warnings.filterwarnings('ignore')
+    t0 = time.perf_counter()
+    from streamlit import config, logger
+    from streamlit.testing.v1 import AppTest
+    config.set_option('logger.level', 'error')
+    logger.set_log_level('error')
+    import_st = time.perf_counter() - t0
+
+    at = AppTest.from_file(APP, default_timeout=600)
+    t0 = time.perf_counter()
+    at.run()
+    frio = time.perf_counter() - t0
+    at.sidebar.text_input[0].set_value(datos)
+    t0 = time.perf_counter()
+    at.run()
+    url = time.perf_counter() - t0
+
+    primera = None
+    if pagina != PAGINAS[0]:
+        at.sidebar.radio[0].set_value(pagina)
+        t0 = time.perf_counter()
+        at.run()
+        primera = time.perf_counter() - t0
+    tiempos = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        tiempos.append(time.perf_counter() - t0)
+    errores = [e.message for e in at.exception] + [e.value for e in at.error]
+    return {
+        'import_streamlit_ms': round(import_st * 1000, 1),
+        'arranque_frio_ms': round(frio * 1000, 1),
+        'cambio_url_ms': round(url * 1000, 1),
+        'primera_apertura_ms': None if primera is None else round(primera * 1000, 1),
+        'rerun_p50_ms': round(statistics.median(tiempos) * 1000, 1) if tiempos else None,
+        'modulos_pesados': [m for m in PESADOS if m in sys.modules],
+        'errores': errores[:5],
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='Arranque en frío y tiempo de rerun por página de la app CHASIDE.')
+    ap.add_argument('--filas', type=int, default=20_000, help='estudiantes en la hoja sintética')
+    ap.add_argument('--datos', help='CSV/Parquet a usar en lugar del sintético')
+    ap.add_argument('--reruns', type=int, default=5, help='reruns medidos por página (default: 5)')
+    ap.add_argument('--datadir', default=os.path.join(AQUI, '.data'))
+    ap.add_argument('--json', help='guardar el resultado en este archivo')
+    ap.add_argument('--hijo', help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.hijo:
+        print(json.dumps(medir_pagina(args.hijo, args.datos, args.reruns), ensure_ascii=False))
+        return 0
+
+    datos = args.datos
+    if datos is None:
+        from chaside.synthetic import write_csv
+        os.makedirs(args.datadir, exist_ok=True)
+        datos = os.path.join(args.datadir, f'chaside_{args.filas}.csv')
+        if not os.path.exists(datos):
+            print(f'  generando {datos} …', file=sys.stderr)
+            write_csv(datos, args.filas, seed=args.filas)
+
+    resultados = {}
+    print(f"{'página':<24}{'frío ms':>10}{'1ª apertura ms':>16}{'rerun p50 ms':>14}   módulos pesados")
+    for pagina in PAGINAS:
+        # proceso nuevo y caché de disco vacía por página: nada viene de la medición anterior
+        env = dict(os.environ, CHASIDE_CACHE_DIR=tempfile.mkdtemp(prefix='chaside-arranque-'))
+        salida = subprocess.run([sys.executable, os.path.abspath(__file__), '--hijo', pagina,
+                                 '--datos', datos, '--reruns', str(args.reruns)],
+                                env=env, capture_output=True, text=True, check=True)
+        r = json.loads(salida.stdout.strip().splitlines()[-1])
+        resultados[pagina] = r
+        primera = '—' if r['primera_apertura_ms'] is None else r['primera_apertura_ms']
+        print(f"{pagina:<24}{r['arranque_frio_ms']:>10}{primera:>16}{r['rerun_p50_ms']:>14}   "
+              f"{', '.join(r['modulos_pesados']) or '—'}")
+        for e in r['errores']:
+            print(f'  ⚠ {e}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fh:
+            json.dump(resultados, fh, indent=2, ensure_ascii=False)
+    return 1 if any(r['errores'] for r in resultados.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
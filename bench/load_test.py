@@ -0,0 +1,299 @@
+# ============================================================
+# CHASIDE • Prueba de carga con sesiones concurrentes (AppTest)
+# ============================================================
+# Simula N orientadores usando la app a la vez, sin navegador: cada sesión
+# es un AppTest de Streamlit en su propio hilo (las cachés cache_resource y
+# el DatasetStore son del proceso, como en el servidor real). La URL de
+# datos apunta a un servidor local que sirve un CSV sintético y cuenta las
+# descargas. Cada sesión alterna entre "Información general" e "Información
+# individual", cambia carrera/estudiante y el modo de las barras apiladas.
+#
+# AppTest no admite reruns simultáneos (usa un Runtime simulado que es un
+# singleton del proceso), así que las sesiones se intercalan y cada rerun
+# toma un turno global. Es el mismo límite que impone el GIL a reruns que
+# usan CPU en un solo proceso de Streamlit: `servicio` es lo que tarda el
+# rerun y `respuesta` incluye la espera en la cola, lo que vería el usuario.
+#
+# Reporta latencia de rerun (p50/p95/p99; la respuesta también por acción), memoria por
+# sesión (Δ RSS / sesiones tras la primera, que carga el dataset compartido)
+# y tasa de aciertos de caché:
+#   load_csv         descargas del servidor local  vs  reruns de páginas de datos
+#   process_chaside  ejecuciones del pipeline      vs  reruns de páginas de datos
+#   agg_pie/stacked  cálculos reales               vs  llamadas a Dataset.derived
+#
+#   python bench/load_test.py --sesiones 20 --pasos 15 --filas 20000
+#   python bench/load_test.py --sesiones 50 --latencia-ms 300 --json carga.json
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chaside import perf                          # noqa: E402
+from chaside.synthetic import write_csv          # noqa: E402
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(os.path.dirname(AQUI), 'main.py')
+GENERAL, INDIVIDUAL = "Información general", "Información individual"
+CACHES = ['load_csv', 'process_chaside', 'agg_pie', 'agg_stacked']
+_TURNO = threading.Lock()      # un rerun de AppTest a la vez (Runtime simulado compartido)
+
+
+class Contadores:
+    """Contadores compartidos entre hilos: {nombre: {'llamadas': n, 'calculos': n}}."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.datos = {c: {'llamadas': 0, 'calculos': 0} for c in CACHES}
+
+    def sumar(self, nombre: str, campo: str, n: int = 1):
+        with self._lock:
+            self.datos[nombre][campo] += n
+
+    def tasas(self) -> dict:
+        out = {}
+        for c, v in self.datos.items():
+            ll = v['llamadas']
+            out[c] = {**v, 'aciertos': None if not ll else round(max(ll - v['calculos'], 0) / ll, 4)}
+        return out
+
+
+def servidor_datos(crudo: bytes, cont: Contadores, latencia: float = 0.0):
+    """Sustituto local de Google Sheets: sirve `crudo` y cuenta descargas (load_csv)."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            cont.sumar('load_csv', 'calculos')
+            if latencia:
+                time.sleep(latencia)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/csv; charset=utf-8')
+            self.send_header('Content-Length', str(len(crudo)))
+            self.end_headers()
+            self.wfile.write(crudo)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def instrumentar(cont: Contadores):
+    """Cuenta cálculos reales sin tocar la app: el pipeline y Dataset.derived
+    se envuelven en el proceso (paginas/datos.py llama a pipeline.process_chaside
+    por atributo y las páginas usan ds.derived, así que ambos se resuelven en
+    cada llamada)."""
+    from chaside import dataset, pipeline
+
+    original_pc = pipeline.process_chaside
+
+    def process_chaside(*args, **kw):
+        cont.sumar('process_chaside', 'calculos')
+        return original_pc(*args, **kw)
+
+    original_der = dataset.Dataset.derived
+
+    def derived(self, clave, fn, *args):
+        nombre = f'agg_{clave}'
+        if nombre not in cont.datos:
+            return original_der(self, clave, fn, *args)
+        cont.sumar(nombre, 'llamadas')
+
+        def calcular(*a):
+            cont.sumar(nombre, 'calculos')
+            return fn(*a)
+        return original_der(self, clave, calcular, *args)
+
+    pipeline.process_chaside = process_chaside
+    dataset.Dataset.derived = derived
+
+
+class Sesion:
+    def __init__(self, k: int, url: str, cont: Contadores, seed: int, timeout: float, pausa: float):
+        from streamlit.testing.v1 import AppTest
+        self.k, self.url, self.cont, self.pausa = k, url, cont, pausa
+        self.rng = random.Random(seed * 1000 + k)
+        self.at = AppTest.from_file(APP, default_timeout=timeout)
+        self.pagina = "Presentación"
+        self.latencias = []        # (acción, servicio s, respuesta s)
+        self.errores = []
+
+    def _rerun(self, accion: str, cambio=None):
+        t0 = time.perf_counter()
+        with _TURNO:
+            t1 = time.perf_counter()
+            if cambio is not None:
+                cambio()
+            self.at.run()
+            t2 = time.perf_counter()
+        self.latencias.append((accion, t2 - t1, t2 - t0))
+        if self.pagina in (GENERAL, INDIVIDUAL):
+            self.cont.sumar('load_csv', 'llamadas')
+            self.cont.sumar('process_chaside', 'llamadas')
+        self.errores += [e.message for e in self.at.exception] + [e.value for e in self.at.error]
+
+    def _widget(self, tipo: str, etiqueta: str):
+        return next((w for w in getattr(self.at, tipo) if w.label == etiqueta), None)
+
+    def _ir(self, pagina: str):
+        self.pagina = pagina
+        self._rerun('página', lambda: self.at.sidebar.radio[0].set_value(pagina))
+
+    def iniciar(self):
+        self._rerun('arranque')
+        self._rerun('url', lambda: self.at.sidebar.text_input[0].set_value(self.url))
+        self._ir(GENERAL)
+
+    def paso(self):
+        if self.pausa:
+            time.sleep(self.rng.uniform(0, 2 * self.pausa))
+        acciones = ['página']
+        if self.pagina == GENERAL:
+            acciones += ['modo'] * 2
+        else:
+            acciones += ['carrera', 'estudiante', 'estudiante']
+        accion = self.rng.choice(acciones)
+        if accion == 'página':
+            return self._ir(INDIVIDUAL if self.pagina == GENERAL else GENERAL)
+        etiqueta, tipo = {'modo': ("Modo de visualización", 'radio'),
+                          'carrera': ("Carrera a evaluar:", 'selectbox'),
+                          'estudiante': ("Estudiante:", 'selectbox')}[accion]
+        w = self._widget(tipo, etiqueta)
+        if w is None or len(w.options) < 2:
+            return self._ir(GENERAL if self.pagina == INDIVIDUAL else INDIVIDUAL)
+        actual = w.value
+        nuevo = self.rng.choice([o for o in w.options if o != actual])
+        self._rerun(accion, lambda: w.set_value(nuevo))
+
+
+def percentiles(seg) -> dict:
+    ms = np.asarray(seg, dtype=float) * 1000
+    if not len(ms):
+        return {'n': 0}
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {'n': int(len(ms)), 'p50_ms': round(p50, 1), 'p95_ms': round(p95, 1),
+            'p99_ms': round(p99, 1), 'max_ms': round(ms.max(), 1)}
+
+
+def correr(args) -> dict:
+    cont = Contadores()
+    ruta = os.path.join(args.datadir, f'chaside_{args.filas}.csv')
+    if not os.path.exists(ruta):
+        print(f'  generando {ruta} …', file=sys.stderr)
+        write_csv(ruta, args.filas, seed=args.filas)
+    with open(ruta, 'rb') as fh:
+        srv = servidor_datos(fh.read(), cont, args.latencia_ms / 1000)
+    url = f'http://127.0.0.1:{srv.server_address[1]}/respuestas.csv'
+    instrumentar(cont)
+
+    rss0 = perf.rss_mb()
+    t0 = time.perf_counter()
+    sesiones = [Sesion(k, url, cont, args.seed, args.timeout, args.pausa_ms / 1000)
+                for k in range(args.sesiones)]
+    # la primera sesión llega sola: descarga, califica y llena las cachés compartidas
+    sesiones[0].iniciar()
+    rss1 = perf.rss_mb()
+    arranque_s = time.perf_counter() - t0
+
+    def recorrer(s: Sesion):
+        if s.k:
+            s.iniciar()
+        for _ in range(args.pasos):
+            s.paso()
+
+    t1 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sesiones) as ex:
+        list(ex.map(recorrer, sesiones))
+    total_s = time.perf_counter() - t1
+    rss2 = perf.rss_mb()
+    srv.shutdown()
+
+    lat = [x for s in sesiones for x in s.latencias]
+    por_accion = {}
+    for accion, _, resp in lat:
+        por_accion.setdefault(accion, []).append(resp)
+    otras = max(args.sesiones - 1, 1)
+    return {
+        'sesiones': args.sesiones, 'pasos': args.pasos, 'filas': args.filas,
+        'reruns': len(lat), 'duracion_s': round(total_s, 2),
+        'reruns_por_s': round(len(lat) / total_s, 1) if total_s else None,
+        'primera_sesion_s': round(arranque_s, 2),
+        'servicio': percentiles([s for _, s, _ in lat]),
+        'respuesta': percentiles([r for _, _, r in lat]),
+        'latencia_por_accion': {a: percentiles(v) for a, v in sorted(por_accion.items())},
+        'memoria_mb': None if rss0 is None else {
+            'inicial': round(rss0, 1),
+            'compartida': round(rss1 - rss0, 1),      # imports + dataset + cachés
+            'por_sesion': round((rss2 - rss1) / otras, 2),
+            'final': round(rss2, 1),
+        },
+        'cache': cont.tasas(),
+        'errores': sorted({e for s in sesiones for e in s.errores})[:10],
+    }
+
+
+def imprimir(r: dict):
+    print(f"▶ {r['sesiones']} sesiones × {r['pasos']} pasos · {r['filas']:,} filas · "
+          f"{r['reruns']} reruns en {r['duracion_s']} s ({r['reruns_por_s']} reruns/s)")
+    print(f"  primera sesión (carga en frío): {r['primera_sesion_s']} s")
+    print(f"  {'latencia':<16}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'máx ms':>10}")
+    filas = [('servicio', r['servicio']), ('respuesta', r['respuesta']),
+             *((f'  {a}', p) for a, p in r['latencia_por_accion'].items())]
+    for nombre, p in filas:
+        if p['n']:
+            print(f"  {nombre:<16}{p['n']:>6}{p['p50_ms']:>10}{p['p95_ms']:>10}{p['p99_ms']:>10}{p['max_ms']:>10}")
+    m = r['memoria_mb']
+    if m:
+        print(f"  memoria: {m['inicial']} MB al inicio, +{m['compartida']} MB compartidos, "
+              f"~{m['por_sesion']} MB por sesión adicional ({m['final']} MB al final)")
+    print(f"  {'caché':<16}{'llamadas':>10}{'cálculos':>10}{'aciertos':>10}")
+    for c, v in r['cache'].items():
+        tasa = '—' if v['aciertos'] is None else f"{v['aciertos']:.1%}"
+        print(f"  {c:<16}{v['llamadas']:>10}{v['calculos']:>10}{tasa:>10}")
+    for e in r['errores']:
+        print(f'⚠ {e}')
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='Prueba de carga de la app CHASIDE con sesiones concurrentes.')
+    ap.add_argument('--sesiones', type=int, default=10, help='sesiones simultáneas (default: 10)')
+    ap.add_argument('--pasos', type=int, default=10, help='interacciones por sesión (default: 10)')
+    ap.add_argument('--filas', type=int, default=20_000, help='estudiantes en la hoja sintética')
+    ap.add_argument('--latencia-ms', type=float, default=0, help='latencia simulada de la descarga')
+    ap.add_argument('--pausa-ms', type=float, default=0, help='tiempo medio de "lectura" entre interacciones')
+    ap.add_argument('--timeout', type=float, default=300, help='límite por rerun en segundos')
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--datadir', default=os.path.join(AQUI, '.data'))
+    ap.add_argument('--json', help='guardar el resultado en este archivo')
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.datadir, exist_ok=True)
+    # caché de disco vacía: la primera sesión mide la calificación en frío
+    os.environ.setdefault('CHASIDE_CACHE_DIR', tempfile.mkdtemp(prefix='chaside-carga-'))
+    warnings.filterwarnings('ignore')
+    from streamlit import config, logger
+    config.set_option('logger.level', 'error')     # sin avisos de deprecación en cada rerun
+    logger.set_log_level('error')
+    r = correr(args)
+    imprimir(r)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fh:
+            json.dump(r, fh, indent=2, ensure_ascii=False)
+    return 1 if r['errores'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
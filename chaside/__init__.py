@@ -0,0 +1,3 @@
+# ============================================================
+# CHASIDE • Núcleo de cálculo (sin Streamlit)
+# ============================================================
@@ -0,0 +1,172 @@
+# ============================================================
+# CHASIDE • Caché persistente en disco de datasets procesados
+# ============================================================
+# La clave es sha256(bytes crudos del CSV + versión de calificación), así
+# que un reinicio, un redeploy o una réplica nueva reutilizan el frame ya
+# calificado sin volver a procesarlo. Cada entrada es un Parquet (los
+# categoricals se conservan); el directorio se limita por tamaño con
+# desalojo LRU (mtime = último uso). `warm_start` precarga en memoria las
+# entradas más recientes (la app lo llama al abrir su primera página de
+# datos, ver paginas/datos.py).
+#
+# La caché es de mejor esfuerzo: si el directorio no se puede crear o una
+# escritura falla (sin pyarrow, disco lleno, columnas que Arrow no
+# convierte) se avisa con un RuntimeWarning, se sigue solo con el LRU en
+# memoria y la carga del dataset nunca falla por ella.
+#
+#   CHASIDE_CACHE_DIR   directorio (default: ~/.cache/chaside)
+#   CHASIDE_CACHE_MB    tamaño máximo en MB (default: 1024)
+
+import hashlib
+import os
+import threading
+import uuid
+import warnings
+from collections import OrderedDict
+
+import pandas as pd
+
+from . import perf
+from .constants import COL_CAR
+from .pipeline import SCORING_VERSION
+
+EXT = '.parquet'
+
+
+def default_dir() -> str:
+    return os.environ.get('CHASIDE_CACHE_DIR',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'chaside'))
+
+
+class DiskCache:
+    def __init__(self, directorio: str = None, max_mb: float = None, en_memoria: int = 2):
+        self.dir = directorio or default_dir()
+        self.max_bytes = int((max_mb or float(os.environ.get('CHASIDE_CACHE_MB', 1024))) * 2**20)
+        self.en_memoria = en_memoria
+        self._mem = OrderedDict()        # clave → df (LRU pequeño en memoria)
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            self.disponible = True
+        except OSError:               # directorio de solo lectura o sin permisos
+            self.disponible = False
+
+    @staticmethod
+    def key(digest_crudo: str, version: str = SCORING_VERSION) -> str:
+        """Clave a partir del sha256 de los bytes crudos y la versión de calificación."""
+        return hashlib.sha256(f'{digest_crudo}:{version}'.encode()).hexdigest()[:40]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.dir, key + EXT)
+
+    def _recordar(self, key, df):
+        with self._lock:
+            self._mem[key] = df
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.en_memoria:
+                self._mem.popitem(last=False)
+
+    def get(self, key: str):
+        """Frame procesado o None. Marca la entrada como usada (LRU)."""
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                df = self._mem[key]
+            else:
+                df = None
+        path = self._path(key)
+        if df is not None:
+            _tocar(path)
+            return df
+        if not self.disponible or not os.path.exists(path):
+            return None
+        try:
+            with perf.stage('disk_cache_read') as reg:
+                df = _restaurar_tipos(pd.read_parquet(path))
+                if reg is not None:
+                    reg['rows'] = len(df)
+        except Exception:             # entrada corrupta o incompleta: se descarta
+            _borrar(path)
+            return None
+        _tocar(path)
+        self._recordar(key, df)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame):
+        """Escritura atómica (archivo temporal + os.replace) y desalojo LRU.
+        Si la escritura falla por cualquier motivo solo se recuerda en memoria."""
+        self._recordar(key, df)
+        if not self.disponible:
+            return
+        path = self._path(key)
+        tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+        with perf.stage('disk_cache_write', rows=len(df)):
+            try:
+                df.to_parquet(tmp, index=True)
+                os.replace(tmp, path)
+            except Exception as e:    # sin pyarrow, disco lleno, tipos que Arrow no convierte…
+                warnings.warn(f'chaside: no se guardó en la caché de disco ({type(e).__name__}: {e})',
+                              RuntimeWarning, stacklevel=2)
+                return
+            finally:
+                _borrar(tmp)
+        self.evict()
+
+    def entries(self):
+        """[(path, bytes, mtime)] de más reciente a más antiguo."""
+        out = []
+        if not self.disponible:
+            return out
+        for nombre in os.listdir(self.dir):
+            if nombre.endswith(EXT):
+                p = os.path.join(self.dir, nombre)
+                try:
+                    st = os.stat(p)
+                except FileNotFoundError:
+                    continue
+                out.append((p, st.st_size, st.st_mtime))
+        return sorted(out, key=lambda e: e[2], reverse=True)
+
+    def evict(self):
+        """Borra las entradas menos usadas hasta quedar bajo max_bytes."""
+        total = 0
+        for path, size, _ in self.entries():
+            total += size
+            if total > self.max_bytes:
+                _borrar(path)
+
+    def warm_start(self, n: int = None, background: bool = True):
+        """Precarga en memoria las n entradas usadas más recientemente."""
+        n = self.en_memoria if n is None else n
+        keys = [os.path.basename(p)[:-len(EXT)] for p, _, _ in self.entries()[:n]]
+
+        def _cargar():
+            for k in reversed(keys):          # la más reciente queda al final del LRU
+                self.get(k)
+        if background:
+            threading.Thread(target=_cargar, name='chaside-warm-start', daemon=True).start()
+        else:
+            _cargar()
+        return keys
+
+
+def _restaurar_tipos(df: pd.DataFrame) -> pd.DataFrame:
+    # Parquet devuelve las categorías de la carrera como 'str'; el pipeline usa 'string'
+    if COL_CAR in df.columns and isinstance(df[COL_CAR].dtype, pd.CategoricalDtype):
+        cats = df[COL_CAR].cat.categories
+        df[COL_CAR] = df[COL_CAR].cat.set_categories(cats.astype('string'), rename=True)
+    return df
+
+
+def _tocar(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _borrar(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
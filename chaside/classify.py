@@ -0,0 +1,99 @@
+# ============================================================
+# CHASIDE • Clasificación vectorizada (área × carrera)
+# ============================================================
+# Área fuerte y carrera se codifican como enteros; todas las reglas
+# (coherencia, carrera mejor perfilada, diagnóstico y semáforo) se
+# precalculan en tablas pequeñas (8 × carreras) y se aplican por indexado.
+# La fila extra (FILA_RECHAZO) representa "información no aceptable".
+
+import numpy as np
+import pandas as pd
+
+from .constants import (AREAS, CAT_INT_TO_UI, CAT_UI_ORDER, FUERTES_SETS,
+                        SUGERIDAS_POR_AREA, SUGERIDAS_POR_AREA_STR,
+                        UMBRAL_COINCIDENCIA)
+
+NO_ACEPTABLE = 'Información no aceptable'
+SIN_SUGERENCIA = 'Sin sugerencia clara'
+FILA_RECHAZO = len(AREAS)
+
+_SUG_SETS = {a: set(SUGERIDAS_POR_AREA[a]) for a in AREAS}
+_SEM_POR_COH = {'Coherente': 'Verde', 'Neutral': 'Amarillo'}
+
+
+def area_codes(area: pd.Series) -> np.ndarray:
+    """Área fuerte (category) → índice en AREAS."""
+    cat = area.astype('category').cat
+    lut = np.array([AREAS.index(str(c)) for c in cat.categories], dtype=np.intp)
+    return lut[cat.codes.to_numpy()]
+
+
+def encode_carreras(carrera: pd.Series):
+    """Códigos de carrera (NA → última columna) y lista de carreras (None = NA)."""
+    codes, uniques = pd.factorize(carrera, use_na_sentinel=True)
+    codes = np.where(codes < 0, len(uniques), codes)
+    return codes, [str(u) for u in uniques] + [None]
+
+
+def _celda(area, carrera):
+    """(coherencia, carrera mejor perfilada, diagnóstico, semáforo) de una
+    combinación área × carrera; area=None es la fila de rechazo."""
+    fuertes = FUERTES_SETS.get(carrera, set()) if carrera is not None else set()
+    if area is None:
+        return None, NO_ACEPTABLE, NO_ACEPTABLE, 'No aceptable'
+    if not fuertes:
+        coh = 'Sin perfil definido'
+    elif area in fuertes:
+        coh = 'Coherente'
+    else:
+        coh = 'Neutral'   # sin 'Baja' en perfiles dados
+
+    c = carrera.strip() if carrera is not None else None
+    mejor = c if c in _SUG_SETS[area] else SUGERIDAS_POR_AREA_STR[area]
+    if c is not None and c == mejor.strip():
+        diag = 'Perfil adecuado'
+    elif mejor == SIN_SUGERENCIA:
+        diag = SIN_SUGERENCIA
+    else:
+        diag = 'Sugerencia: ' + mejor
+    sem = 'Sin sugerencia' if diag == SIN_SUGERENCIA else _SEM_POR_COH.get(coh, 'Sin sugerencia')
+    return coh, mejor, diag, sem
+
+
+def lookup_tables(carreras: list) -> dict:
+    """Tablas (8 × K): 'coh', 'mejor', 'diag', 'sem' (cadenas) y 'ui' (código
+    de Categoría_UI, -1 = fuera de la UI)."""
+    filas = AREAS + [None]
+    shape = (len(filas), len(carreras))
+    tab = {n: np.empty(shape, dtype=object) for n in ('coh', 'mejor', 'diag', 'sem')}
+    tab['ui'] = np.full(shape, -1, dtype=np.int8)
+    for j, car in enumerate(carreras):
+        for i, a in enumerate(filas):
+            coh, mejor, diag, sem = _celda(a, car)
+            tab['coh'][i, j], tab['mejor'][i, j], tab['diag'][i, j], tab['sem'][i, j] = coh, mejor, diag, sem
+            if sem in CAT_INT_TO_UI:
+                tab['ui'][i, j] = CAT_UI_ORDER.index(CAT_INT_TO_UI[sem])
+    return tab
+
+
+def classify(coinc: np.ndarray, area_idx: np.ndarray, carrera: pd.Series) -> pd.DataFrame:
+    """Coincidencia_Ponderada, Carrera_Mejor_Perfilada, Diagnóstico Primario
+    Vocacional, Semáforo Vocacional y Categoría_UI por indexado de tablas."""
+    car_codes, carreras = encode_carreras(carrera)
+    tab = lookup_tables(carreras)
+    fila = np.where(np.asarray(coinc) >= UMBRAL_COINCIDENCIA, FILA_RECHAZO, area_idx)
+    return classify_codes(tab, fila, area_idx, car_codes, carrera.index)
+
+
+def classify_codes(tab: dict, fila: np.ndarray, area_idx: np.ndarray,
+                   car_codes: np.ndarray, idx) -> pd.DataFrame:
+    """Columnas de clasificación a partir de códigos ya calculados (fila de
+    tabla por estudiante, área fuerte y carrera); lo reutiliza chaside.whatif."""
+    return pd.DataFrame({
+        'Coincidencia_Ponderada': pd.Series(tab['coh'][area_idx, car_codes], index=idx, dtype='string'),
+        'Carrera_Mejor_Perfilada': pd.Series(tab['mejor'][fila, car_codes], index=idx),
+        'Diagnóstico Primario Vocacional': pd.Series(tab['diag'][fila, car_codes], index=idx, dtype='string'),
+        'Semáforo Vocacional': pd.Series(tab['sem'][fila, car_codes], index=idx),
+        'Categoría_UI': pd.Categorical.from_codes(tab['ui'][fila, car_codes],
+                                                  categories=CAT_UI_ORDER, ordered=True),
+    }, index=idx)
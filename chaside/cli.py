@@ -0,0 +1,167 @@
+# ============================================================
+# CHASIDE • Calificación batch por línea de comandos (sin Streamlit)
+# ============================================================
+# Lee las respuestas (CSV, Parquet o Arrow/Feather) en bloques de tamaño
+# fijo, procesa cada bloque con el mismo pipeline del dashboard y escribe el
+# resultado en streaming (CSV, Parquet o Arrow/Feather): la memoria no crece
+# con el tamaño del archivo.
+#
+#   python -m chaside respuestas.csv -o resultados.parquet --chunksize 50000 --workers 4
+
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .history import HistoryStore, cohort_years
+from .io import EXT_ARROW, EXT_PARQUET, is_columnar, iter_columnar
+from .pipeline import process_chaside
+
+
+def score_chunk(chunk: pd.DataFrame, packed: bool = False) -> pd.DataFrame:
+    """Procesa un bloque y deja tipos estables entre bloques para la salida."""
+    chunk.columns = [str(c) for c in chunk.columns]
+    df, _, _ = process_chaside(chunk, packed=packed)
+    # las categorías cambian de bloque a bloque → texto plano en la salida
+    for c in df.columns:
+        if isinstance(df[c].dtype, pd.CategoricalDtype):
+            df[c] = df[c].astype('string')
+    return df
+
+
+def iter_scored(path, chunksize: int, workers: int = 1, packed: bool = False):
+    """Bloques procesados en el orden del archivo; con workers > 1 se reparten
+    en un pool de procesos con a lo sumo 2×workers bloques en vuelo."""
+    if is_columnar(path):
+        # ⚡ mapeado a memoria y proyectado: solo marca temporal, ítems, carrera y nombre
+        reader = iter_columnar(path, chunksize)
+    else:
+        # dtype=str: los ítems son texto de todos modos y el esquema no varía entre bloques
+        reader = pd.read_csv(path, chunksize=chunksize, dtype=str)
+    if workers <= 1:
+        for chunk in reader:
+            yield score_chunk(chunk, packed)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pendientes = deque()
+        for chunk in reader:
+            pendientes.append(ex.submit(score_chunk, chunk, packed))
+            if len(pendientes) >= 2 * workers:
+                yield pendientes.popleft().result()
+        while pendientes:
+            yield pendientes.popleft().result()
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self.fh = open(path, 'w', encoding='utf-8', newline='')
+        self.first = True
+
+    def write(self, df: pd.DataFrame):
+        df.to_csv(self.fh, header=self.first, index=False)
+        self.first = False
+
+    def close(self):
+        self.fh.close()
+
+
+class _ParquetSink:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:   # está en requirements.txt; solo falta en instalaciones mínimas
+            raise SystemExit("La salida Parquet/Arrow requiere 'pyarrow' (pip install pyarrow).") from e
+        self.pa, self.pq, self.path = pa, pq, path
+        self.writer = None
+
+    def write(self, df: pd.DataFrame):
+        if self.writer is None:
+            table = self.pa.Table.from_pandas(df, preserve_index=False)
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = self.pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=False)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class _ArrowSink(_ParquetSink):
+    """Arrow IPC / Feather v2 sin comprimir: se relee mapeado a memoria sin copias."""
+
+    def write(self, df: pd.DataFrame):
+        if self.writer is None:
+            table = self.pa.Table.from_pandas(df, preserve_index=False)
+            self.schema = table.schema
+            self.writer = self.pa.ipc.new_file(self.path, table.schema)
+        else:
+            table = self.pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+        self.writer.write_table(table)
+
+
+def open_sink(path: str):
+    ext = str(path).lower()
+    if ext.endswith(EXT_PARQUET):
+        return _ParquetSink(path)
+    if ext.endswith(EXT_ARROW):
+        return _ArrowSink(path)
+    return _CsvSink(path)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog='python -m chaside',
+                                 description='Calificación CHASIDE batch (CSV/Parquet/Arrow → CSV/Parquet/Arrow).')
+    ap.add_argument('entrada', help='respuestas: CSV (ruta local o URL), .parquet o .feather/.arrow')
+    ap.add_argument('-o', '--salida', help='archivo de salida (.csv, .parquet o .feather/.arrow)')
+    ap.add_argument('--chunksize', type=int, default=50_000, help='filas por bloque (default: 50000)')
+    ap.add_argument('--workers', type=int, default=1, help='procesos en paralelo (default: 1)')
+    ap.add_argument('--packed', action='store_true',
+                    help='guardar los 98 ítems como 13 columnas de bits (BITS_00..BITS_12)')
+    ap.add_argument('--historico', nargs='?', const='', metavar='DIR',
+                    help='guardar también en el histórico particionado por cohorte y carrera '
+                         '(default: $CHASIDE_HISTORY_DIR); las cohortes recalificadas se reemplazan')
+    ap.add_argument('--anio', type=int, help='cohorte para el histórico (default: año de la marca temporal)')
+    args = ap.parse_args(argv)
+    if args.salida is None and args.historico is None:
+        ap.error('indica -o/--salida, --historico o ambos')
+
+    t0 = time.perf_counter()
+    n_filas = n_bloques = 0
+    invalidos = {}
+    sink = open_sink(args.salida) if args.salida else None
+    historico = HistoryStore(args.historico or None) if args.historico is not None else None
+    vistas = set()
+    try:
+        for df in iter_scored(args.entrada, args.chunksize, args.workers, args.packed):
+            if sink is not None:
+                sink.write(df)
+            if historico is not None:
+                # la primera vez que aparece una cohorte se borra la versión anterior
+                anios = {args.anio} if args.anio else set(cohort_years(df).dropna().astype(int))
+                for a in anios - vistas:
+                    historico.drop(a)
+                vistas |= anios
+                historico.write(df, anio=args.anio, reemplazar=False)
+            n_filas += len(df); n_bloques += 1
+            for t, n in df.attrs.get('respuestas_invalidas', {}).items():
+                invalidos[t] = invalidos.get(t, 0) + n
+    finally:
+        if sink is not None:
+            sink.close()
+
+    destinos = [d for d in (args.salida, historico and f'histórico {historico.raiz} {sorted(vistas)}') if d]
+    print(f"✔ {n_filas} filas en {n_bloques} bloques → {', '.join(destinos)} "
+          f"({time.perf_counter() - t0:.1f} s)", file=sys.stderr)
+    if invalidos:
+        print(f"⚠ respuestas no reconocidas (contadas como 'No'): {invalidos}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
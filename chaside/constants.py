@@ -0,0 +1,74 @@
+# ============================================================
+# CHASIDE • Constantes de la escala y del formulario
+# ============================================================
+
+# Columnas fijas del formulario
+COL_CAR = '¿A qué carrera desea ingresar?'
+COL_NOM = 'Ingrese su nombre completo'
+COL_FUENTE = 'Fuente'   # cohorte/plantel de origen al combinar varias hojas
+COL_COHORTE = 'Cohorte' # año de ingreso en el histórico (chaside.history)
+N_META = 5        # columnas de metadatos antes de los ítems
+N_ITEMS = 98      # ítems Sí/No de la escala
+
+# Ponderación fija intereses/aptitudes
+PESO_INTERES, PESO_APTITUD = 0.8, 0.2
+# Coincidencia ≥ umbral → respuestas no aceptables (sesgo Sí/No)
+UMBRAL_COINCIDENCIA = 0.75
+
+INTERESES_ITEMS = {
+    'C':[1,12,20,53,64,71,78,85,91,98],
+    'H':[9,25,34,41,56,67,74,80,89,95],
+    'A':[3,11,21,28,36,45,50,57,81,96],
+    'S':[8,16,23,33,44,52,62,70,87,92],
+    'I':[6,19,27,38,47,54,60,75,83,97],
+    'D':[5,14,24,31,37,48,58,65,73,84],
+    'E':[17,32,35,42,49,61,68,77,88,93]
+}
+APTITUDES_ITEMS = {
+    'C':[2,15,46,51],'H':[30,63,72,86],'A':[22,39,76,82],
+    'S':[4,29,40,69],'I':[10,26,59,90],'D':[13,18,43,66],'E':[7,55,79,94]
+}
+AREAS = ['C','H','A','S','I','D','E']
+
+PERFIL_CARRERAS = {
+    'Arquitectura': {'Fuerte': ['A','I','C']},
+    'Contador Público': {'Fuerte': ['C','D']},
+    'Licenciatura en Administración': {'Fuerte': ['C','D']},
+    'Ingeniería Ambiental': {'Fuerte': ['I','C','E']},
+    'Ingeniería Bioquímica': {'Fuerte': ['I','C','E']},
+    'Ingeniería en Gestión Empresarial': {'Fuerte': ['C','D','H']},
+    'Ingeniería Industrial': {'Fuerte': ['C','D','H']},
+    'Ingeniería en Inteligencia Artificial': {'Fuerte': ['I','E']},
+    'Ingeniería Mecatrónica': {'Fuerte': ['I','E']},
+    'Ingeniería en Sistemas Computacionales': {'Fuerte': ['I','E']}
+}
+
+# ⚡ precomputo: para cada área, cadena de sugeridas y set para membership
+SUGERIDAS_POR_AREA = {a: sorted([c for c,p in PERFIL_CARRERAS.items() if a in p.get('Fuerte', [])]) for a in AREAS}
+SUGERIDAS_POR_AREA_STR = {a: ", ".join(SUGERIDAS_POR_AREA[a]) if SUGERIDAS_POR_AREA[a] else "Sin sugerencia clara" for a in AREAS}
+FUERTES_SETS = {c: set(p.get('Fuerte', [])) for c,p in PERFIL_CARRERAS.items()}
+
+DESC_CHASIDE = {
+    "C": "Organización, supervisión, orden, análisis y síntesis, colaboración, cálculo.",
+    "H": "Precisión verbal, organización, relación de hechos, justicia, persuasión.",
+    "A": "Estético y creativo; detallista, innovador, intuitivo; habilidades visuales, auditivas y manuales.",
+    "S": "Asistir y ayudar; investigación, precisión, percepción, análisis; altruismo y paciencia.",
+    "I": "Cálculo y pensamiento científico/crítico; exactitud, planificación; enfoque práctico.",
+    "D": "Justicia y equidad; colaboración, liderazgo; valentía y toma de decisiones.",
+    "E": "Investigación; orden, análisis y síntesis; cálculo numérico, observación; método y seguridad.",
+}
+
+# Categorías internas (semáforo) y etiquetas de UI
+CAT_INT_ORDER = ["Verde", "Amarillo", "Rojo", "No aceptable"]
+CAT_INT_TO_UI = {
+    "Verde":        "Perfil congruente con la carrera seleccionada",
+    "Amarillo":     "Perfil incongruente al seleccionado",
+    "Rojo":         "Perfil no definido",
+    "No aceptable": "Respuestas no válidas (sesgo de respuesta)"
+}
+CAT_UI_ORDER = [
+    "Perfil congruente con la carrera seleccionada",
+    "Perfil incongruente al seleccionado",
+    "Perfil no definido",
+    "Respuestas no válidas (sesgo de respuesta)"
+]
@@ -0,0 +1,136 @@
+# ============================================================
+# CHASIDE • Cubo de agregados carrera × categoría × medida
+# ============================================================
+# Conteos, sumas y sumas de cuadrados por (carrera, categoría UI) para las
+# medidas TOTAL_* y Score. Se construye una vez tras process_chaside (O(N)
+# con np.bincount) y las gráficas del panel general leen de él en
+# O(carreras). Los cubos son aditivos: se pueden sumar/restar (deltas).
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from . import perf
+from .constants import AREAS, CAT_UI_ORDER, COL_CAR
+
+MEDIDAS = [f'TOTAL_{a}' for a in AREAS] + ['Score']
+# categorías del cubo: las 4 de la UI + una ranura para filas sin categoría
+_N_CAT = len(CAT_UI_ORDER) + 1
+
+
+@dataclass
+class AggCube:
+    carreras: list          # nombres; None = ranura de carrera faltante (siempre al final)
+    n: np.ndarray           # (K+1) × 5            conteos
+    suma: np.ndarray        # (K+1) × 5 × medidas  sumas
+    suma2: np.ndarray       # (K+1) × 5 × medidas  sumas de cuadrados
+
+    # ---------- construcción ----------
+    @classmethod
+    @perf.timed('agg_cube')
+    def from_frame(cls, df: pd.DataFrame, col_car: str = COL_CAR, weights=None) -> 'AggCube':
+        """Cubo de un frame procesado; weights = multiplicidad por fila (deltas)."""
+        car = df[col_car].astype('category').cat
+        carreras = [str(c) for c in car.categories]
+        k = len(carreras)
+        car_codes = car.codes.to_numpy().astype(np.int64)
+        car_codes[car_codes < 0] = k
+        cat_codes = df['Categoría_UI'].cat.codes.to_numpy().astype(np.int64)
+        cat_codes[cat_codes < 0] = _N_CAT - 1
+
+        key = car_codes * _N_CAT + cat_codes
+        size = (k + 1) * _N_CAT
+        w = np.ones(len(df)) if weights is None else np.asarray(weights, dtype=np.float64)
+        n = np.bincount(key, weights=w, minlength=size)
+        vals = df[MEDIDAS].to_numpy(dtype=np.float64)
+        suma = np.stack([np.bincount(key, weights=w * v, minlength=size) for v in vals.T], axis=-1)
+        suma2 = np.stack([np.bincount(key, weights=w * v * v, minlength=size) for v in vals.T], axis=-1)
+        shape = (k + 1, _N_CAT)
+        return cls(carreras + [None], np.rint(n).astype(np.int64).reshape(shape),
+                   suma.reshape(shape + (len(MEDIDAS),)), suma2.reshape(shape + (len(MEDIDAS),)))
+
+    @classmethod
+    def empty(cls) -> 'AggCube':
+        m = len(MEDIDAS)
+        return cls([None], np.zeros((1, _N_CAT), np.int64),
+                   np.zeros((1, _N_CAT, m)), np.zeros((1, _N_CAT, m)))
+
+    def _alinear(self, carreras):
+        pos = {c: i for i, c in enumerate(self.carreras)}
+        idx = np.array([pos.get(c, -1) for c in carreras])
+        n = np.zeros((len(carreras), _N_CAT), np.int64)
+        suma = np.zeros((len(carreras),) + self.suma.shape[1:])
+        suma2 = np.zeros_like(suma)
+        ok = idx >= 0
+        n[ok], suma[ok], suma2[ok] = self.n[idx[ok]], self.suma[idx[ok]], self.suma2[idx[ok]]
+        return n, suma, suma2
+
+    def combine(self, other: 'AggCube', sign: int = 1) -> 'AggCube':
+        """self + sign·other, alineando carreras por nombre (orden alfabético)."""
+        carreras = sorted({c for c in self.carreras + other.carreras if c is not None}) + [None]
+        a, b = self._alinear(carreras), other._alinear(carreras)
+        n = a[0] + sign * b[0]
+        vivas = n.sum(axis=1) > 0
+        vivas[-1] = True
+        sel = np.flatnonzero(vivas)
+        return AggCube([carreras[i] for i in sel], n[sel],
+                       (a[1] + sign * b[1])[sel], (a[2] + sign * b[2])[sel])
+
+    # ---------- lecturas O(carreras) ----------
+    def carreras_presentes(self) -> list:
+        tot = self.n[:-1].sum(axis=1)
+        return [c for c, t in zip(self.carreras[:-1], tot) if t > 0]
+
+    def pie(self) -> pd.DataFrame:
+        """Mismo formato que agg_pie: Categoría_UI, N."""
+        return pd.DataFrame({'Categoría_UI': CAT_UI_ORDER,
+                             'N': self.n[:, :len(CAT_UI_ORDER)].sum(axis=0)})
+
+    def stacked(self, col_car: str = COL_CAR, pct: bool = False) -> pd.DataFrame:
+        """Mismo formato que agg_stacked (solo combinaciones observadas); con
+        pct=True añade la columna '%' dentro de cada carrera."""
+        n = self.n[:-1, :len(CAT_UI_ORDER)]
+        i, j = np.nonzero(n)
+        out = pd.DataFrame({
+            col_car: pd.Categorical.from_codes(i, categories=self.carreras[:-1]),
+            'Categoría_UI': pd.Categorical.from_codes(j, categories=CAT_UI_ORDER, ordered=True),
+            'N': n[i, j],
+        })
+        if pct:
+            tot = n.sum(axis=1)
+            out['%'] = n[i, j] / tot[i] * 100
+        return out
+
+    def _celdas(self, carrera: str, categorias: list):
+        i = self.carreras.index(carrera)
+        j = [CAT_UI_ORDER.index(c) for c in categorias]
+        return self.n[i, j], self.suma[i, j], self.suma2[i, j]
+
+    def count(self, carrera: str, categorias: list) -> np.ndarray:
+        if carrera not in self.carreras:
+            return np.zeros(len(categorias), np.int64)
+        return self._celdas(carrera, categorias)[0]
+
+    def mean(self, carrera: str, categorias: list, medidas=None) -> pd.DataFrame:
+        """Promedios por categoría (filas) y medida (columnas)."""
+        n, s, _ = self._celdas(carrera, categorias)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            m = s / n[:, None]
+        out = pd.DataFrame(m, index=pd.Index(categorias, name='Categoría_UI'), columns=MEDIDAS)
+        return out if medidas is None else out[medidas]
+
+    def std(self, carrera: str, categorias: list, medidas=None) -> pd.DataFrame:
+        """Desviación estándar muestral (ddof=1) desde sumas y sumas de cuadrados."""
+        n, s, s2 = self._celdas(carrera, categorias)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = (s2 - s * s / n[:, None]) / (n[:, None] - 1)
+        out = pd.DataFrame(np.sqrt(np.clip(var, 0, None)),
+                           index=pd.Index(categorias, name='Categoría_UI'), columns=MEDIDAS)
+        return out if medidas is None else out[medidas]
+
+    def carreras_con(self, categorias: list) -> list:
+        """Carreras con al menos un estudiante en alguna de las categorías."""
+        j = [CAT_UI_ORDER.index(c) for c in categorias]
+        tot = self.n[:-1, j].sum(axis=1)
+        return [c for c, t in zip(self.carreras[:-1], tot) if t > 0]
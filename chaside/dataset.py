@@ -0,0 +1,113 @@
+# ============================================================
+# CHASIDE • Dataset procesado compartido entre sesiones
+# ============================================================
+# Un único frame calificado por versión de la fuente, común a todas las
+# sesiones del proceso (antes `st.cache_data` entregaba una copia a cada
+# llamada). Quien lo usa recibe vistas superficiales: con Copy-on-Write
+# cualquier modificación copia solo lo que toca y nunca alcanza al frame
+# compartido. Los agregados derivados (pastel, barras, contexto de carrera…)
+# se memorizan por `version`, una cadena barata, en lugar de hashear el frame.
+
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from .constants import COL_CAR, COL_NOM
+from .cube import AggCube
+from .index import StudentIndex
+
+if int(pd.__version__.split('.')[0]) < 3:    # pandas 3 ya trae Copy-on-Write siempre
+    pd.set_option('mode.copy_on_write', True)
+
+
+def _vista(valor):
+    """Frames/Series derivados se entregan como vista para que nadie mute el memorizado."""
+    if isinstance(valor, (pd.DataFrame, pd.Series)):
+        return valor.copy(deep=False)
+    return valor
+
+
+class Dataset:
+    """Frame procesado inmutable + cubo de agregados + índice de estudiantes."""
+
+    __slots__ = ('version', 'col_car', 'col_nom', 'cube', 'index',
+                 '_df', '_derivados', '_lock')
+
+    def __init__(self, df: pd.DataFrame, version: str, cube: AggCube = None,
+                 index: StudentIndex = None, col_car: str = COL_CAR, col_nom: str = COL_NOM):
+        self._df = df
+        self.version = version
+        self.col_car, self.col_nom = col_car, col_nom
+        self.cube = cube if cube is not None else AggCube.from_frame(df, col_car)
+        self.index = index if index is not None else StudentIndex(df, col_car, col_nom)
+        self._derivados = {}
+        self._lock = threading.Lock()
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Vista de solo lectura: comparte buffers con el frame compartido."""
+        return self._df.copy(deep=False)
+
+    def __len__(self):
+        return len(self._df)
+
+    @property
+    def attrs(self) -> dict:
+        return self._df.attrs
+
+    def derived(self, clave, fn, *args):
+        """Resultado de `fn(*args)` memorizado bajo (clave, args) para esta versión."""
+        k = (clave, *args)
+        try:
+            return _vista(self._derivados[k])
+        except KeyError:
+            pass
+        valor = fn(*args)
+        with self._lock:
+            valor = self._derivados.setdefault(k, valor)
+        return _vista(valor)
+
+
+class DatasetStore:
+    """Un Dataset por versión de la fuente; LRU de `max_versiones` entradas.
+
+    Cada versión se construye una sola vez aunque varias sesiones la pidan a la
+    vez: las demás esperan al constructor en curso."""
+
+    def __init__(self, max_versiones: int = 4):
+        self.max_versiones = max_versiones
+        self._datasets = OrderedDict()
+        self._construyendo = {}
+        self._lock = threading.Lock()
+
+    def get(self, version: str, build):
+        """Dataset de `version`; si no existe, `build()` → df procesado."""
+        with self._lock:
+            ds = self._datasets.get(version)
+            if ds is not None:
+                self._datasets.move_to_end(version)
+                return ds
+            lock_v = self._construyendo.setdefault(version, threading.Lock())
+        with lock_v:
+            with self._lock:
+                ds = self._datasets.get(version)
+            if ds is None:
+                ds = build()
+                if not isinstance(ds, Dataset):
+                    ds = Dataset(ds, version)
+                self.put(ds)
+        with self._lock:
+            self._construyendo.pop(version, None)
+        return ds
+
+    def put(self, ds: Dataset):
+        with self._lock:
+            self._datasets[ds.version] = ds
+            self._datasets.move_to_end(ds.version)
+            while len(self._datasets) > self.max_versiones:
+                self._datasets.popitem(last=False)
+
+    def versions(self):
+        with self._lock:
+            return list(self._datasets)
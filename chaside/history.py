@@ -0,0 +1,177 @@
+# ============================================================
+# CHASIDE • Histórico particionado por cohorte y carrera
+# ============================================================
+# Cada cohorte calificada se guarda como dataset Parquet con particiones
+# Hive  Cohorte=2025/carrera=Arquitectura/part-….parquet. Las consultas
+# leen solo las particiones (filtros por cohorte/carrera) y las columnas que
+# pide la vista, p. ej. los TOTAL_* de una carrera en los últimos tres años,
+# sin concatenar en memoria el frame completo de cada año.
+#
+#   CHASIDE_HISTORY_DIR   directorio raíz (default: ~/.local/share/chaside/historico)
+#
+# pyarrow es obligatorio para este módulo (se importa al usarlo).
+
+import hashlib
+import os
+import shutil
+import uuid
+
+import pandas as pd
+
+from . import perf
+from .constants import CAT_UI_ORDER, COL_CAR, COL_COHORTE
+from .paths import history_dir as default_dir, saved_cohorts
+
+_CAMPO_CAR = 'carrera'       # la carrera como clave de partición (nombre corto de directorio)
+
+
+def cohort_years(df: pd.DataFrame) -> pd.Series:
+    """Año de cada fila a partir de la marca temporal (1ª columna); <NA> si no se reconoce.
+    Basta el primer número de 4 cifras 19xx/20xx: vale para '01/02/2025 8:00' y '2025-02-01'."""
+    ts = df.iloc[:, 0]
+    if pd.api.types.is_datetime64_any_dtype(ts):
+        return ts.dt.year.astype('Int16')
+    anio = ts.astype('string').str.extract(r'((?:19|20)\d{2})', expand=False)
+    return pd.to_numeric(anio).astype('Int16')
+
+
+def _arrow():
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+    return pa, pads
+
+
+def _particionado():
+    pa, pads = _arrow()
+    return pads.partitioning(pa.schema([(COL_COHORTE, pa.int16()), (_CAMPO_CAR, pa.string())]),
+                             flavor='hive')
+
+
+def _filtro_particion(years=None, careers=None):
+    """Expresión sobre las claves de partición (None = todas las particiones)."""
+    import pyarrow.compute as pc
+    filtro = None
+    for cond in (None if years is None else pc.field(COL_COHORTE).isin([int(a) for a in years]),
+                 None if careers is None else pc.field(_CAMPO_CAR).isin([str(c) for c in careers])):
+        if cond is not None:
+            filtro = cond if filtro is None else filtro & cond
+    return filtro
+
+
+def _restaurar_tipos(df: pd.DataFrame) -> pd.DataFrame:
+    """Categoricals como los deja process_chaside (se guardan como texto)."""
+    if _CAMPO_CAR in df.columns:
+        df = df.rename(columns={_CAMPO_CAR: COL_CAR})
+    if COL_CAR in df.columns:
+        df[COL_CAR] = df[COL_CAR].astype('string').astype('category')
+    if 'Area_Fuerte_Ponderada' in df.columns:
+        df['Area_Fuerte_Ponderada'] = df['Area_Fuerte_Ponderada'].astype(object).astype('category')
+    if 'Categoría_UI' in df.columns:
+        df['Categoría_UI'] = pd.Categorical(df['Categoría_UI'], categories=CAT_UI_ORDER, ordered=True)
+    return df
+
+
+class HistoryStore:
+    def __init__(self, raiz: str = None):
+        self.raiz = raiz or default_dir()
+
+    # ---------- escritura ----------
+    def write(self, df: pd.DataFrame, anio: int = None, reemplazar: bool = True) -> list:
+        """Guarda un frame procesado. Sin `anio`, la cohorte sale de la marca
+        temporal de cada fila. Con reemplazar=True las cohortes presentes en
+        `df` se sobrescriben (recalificar un año no duplica filas).
+        Devuelve las cohortes escritas."""
+        pa, pads = _arrow()
+        anios = (pd.Series(anio, index=df.index, dtype='Int16') if anio is not None
+                 else cohort_years(df))
+        if anios.isna().any():
+            raise ValueError(f"{int(anios.isna().sum())} filas sin fecha reconocible; indica la cohorte (anio=…)")
+        escritas = sorted(int(a) for a in anios.unique())
+
+        datos = df.rename(columns={COL_CAR: _CAMPO_CAR})
+        for c in datos.columns:                       # texto plano: esquema estable entre cohortes
+            if isinstance(datos[c].dtype, pd.CategoricalDtype):
+                datos[c] = datos[c].astype('string')
+        datos[COL_COHORTE] = anios.to_numpy(dtype='int16')
+
+        with perf.stage('history_write', rows=len(df)):
+            if reemplazar:
+                for a in escritas:
+                    shutil.rmtree(self._dir_cohorte(a), ignore_errors=True)
+            pads.write_dataset(pa.Table.from_pandas(datos, preserve_index=False), self.raiz,
+                               format='parquet', partitioning=_particionado(),
+                               basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+                               existing_data_behavior='overwrite_or_ignore')
+        return escritas
+
+    def drop(self, anio: int):
+        shutil.rmtree(self._dir_cohorte(anio), ignore_errors=True)
+
+    # ---------- metadatos (solo listado de directorios) ----------
+    def _dir_cohorte(self, anio) -> str:
+        return os.path.join(self.raiz, f'{COL_COHORTE}={int(anio)}')
+
+    def years(self) -> list:
+        return saved_cohorts(self.raiz)
+
+    def version(self, anios=None) -> str:
+        """Firma barata de las cohortes (nombres, tamaños y mtimes de sus archivos)."""
+        h = hashlib.blake2b(digest_size=8)
+        for a in (self.years() if anios is None else sorted(anios)):
+            for base, _, archivos in sorted(os.walk(self._dir_cohorte(a))):
+                for n in sorted(archivos):
+                    info = os.stat(os.path.join(base, n))
+                    h.update(f'{base}/{n}:{info.st_size}:{info.st_mtime_ns}\n'.encode())
+        return 'hist-' + h.hexdigest()
+
+    # ---------- consultas ----------
+    def query(self, columns=None, years=None, careers=None, where=None) -> pd.DataFrame:
+        """Filas de las cohortes/carreras pedidas con solo `columns` (más Cohorte y carrera).
+
+        Los filtros por cohorte y carrera descartan particiones completas sin
+        abrirlas; `where` es una expresión pyarrow.compute adicional que se
+        empuja a la lectura de los row groups."""
+        _, pads = _arrow()
+        if not self.years():
+            return pd.DataFrame(columns=[COL_COHORTE, COL_CAR, *(columns or [])])
+
+        particion = _filtro_particion(years, careers)
+        filtro = where if particion is None else (particion if where is None else particion & where)
+        cols = None
+        if columns is not None:
+            pedidas = [_CAMPO_CAR if c == COL_CAR else c for c in columns]
+            cols = list(dict.fromkeys([COL_COHORTE, _CAMPO_CAR, *pedidas]))
+
+        with perf.stage('history_query') as reg:
+            dataset = pads.dataset(self.raiz, format='parquet', partitioning=_particionado(),
+                                   schema=self._esquema(particion))
+            df = dataset.to_table(columns=cols, filter=filtro).to_pandas()
+            if reg is not None:
+                reg['rows'] = len(df)
+        return _restaurar_tipos(df)
+
+    def _esquema(self, particion=None):
+        """Esquema unificado de los archivos de las particiones consultadas.
+
+        pads.dataset infiere el esquema del primer archivo: una columna que
+        solo tienen cohortes posteriores (p. ej. Fuente) se perdería. Solo se
+        leen los pies de los archivos que pasan el filtro de partición."""
+        pa, pads = _arrow()
+        dataset = pads.dataset(self.raiz, format='parquet', partitioning=_particionado())
+        fragmentos = dataset.get_fragments() if particion is None else dataset.get_fragments(filter=particion)
+        esquemas = [f.physical_schema for f in fragmentos]
+        if not esquemas:              # ninguna partición coincide: la consulta sale vacía
+            return dataset.schema
+        return pa.unify_schemas([*esquemas, _particionado().schema], promote_options='permissive')
+
+    def cohort(self, anio: int) -> pd.DataFrame:
+        """Cohorte completa, lista para Dataset/AggCube (mismas columnas y tipos)."""
+        df = self.query(years=[anio])
+        cols = [c for c in df.columns if c != COL_COHORTE] + [COL_COHORTE]
+        return df[cols]
+
+    def trend(self, carrera: str, medidas: list, ultimos: int = 3) -> pd.DataFrame:
+        """Promedio de `medidas` por cohorte de una carrera en los últimos `ultimos` años."""
+        anios = self.years()[-ultimos:]
+        df = self.query(columns=medidas, years=anios, careers=[carrera])
+        return df.groupby(COL_COHORTE)[medidas].mean()
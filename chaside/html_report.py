@@ -0,0 +1,232 @@
+# ============================================================
+# CHASIDE • Reportes individuales HTML en lote (zip)
+# ============================================================
+# Un HTML autocontenido por estudiante (KPIs, fortalezas y áreas de
+# oportunidad frente a la referencia Verde de su carrera, carreras
+# sugeridas y un radar SVG en línea), para una carrera o para todas.
+#
+# Las estadísticas de cada carrera (career_context: vector de referencia,
+# top-5, conteos) se calculan una sola vez en el proceso principal; los
+# bloques de estudiantes se renderizan en un pool de procesos (a lo sumo
+# 2×workers bloques en vuelo) y cada HTML se escribe en el zip en cuanto
+# llega, así que la memoria no crece con el número de reportes.
+#
+#   python -m chaside.html_report respuestas.csv -o reportes.zip [--carrera "..."] --workers 4
+
+import argparse
+import math
+import multiprocessing
+import os
+import re
+import sys
+import time
+import unicodedata
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+
+import pandas as pd
+
+from . import perf
+from .constants import (APTITUDES_ITEMS, AREAS, COL_CAR, COL_NOM, DESC_CHASIDE,
+                        INTERESES_ITEMS, PERFIL_CARRERAS, SUGERIDAS_POR_AREA)
+from .report import REF_COLS, career_context, career_report
+
+BLOQUE = 500                     # estudiantes por tarea del pool
+_MAX_AREA = {a: len(INTERESES_ITEMS[a]) + len(APTITUDES_ITEMS[a]) for a in AREAS}
+_DESC = {a: escape(d) for a, d in DESC_CHASIDE.items()}
+_COLORES_IND = {"Joven promesa": "#22c55e", "Alumno en riesgo de reprobar": "#f59e0b"}
+
+_CSS = """body{font-family:system-ui,-apple-system,'Segoe UI',sans-serif;color:#1f2937;max-width:860px;margin:2rem auto;padding:0 1rem}
+h1{color:#0F766E;font-size:1.6rem;margin-bottom:.2rem}h2{color:#0F766E;font-size:1.1rem;margin-top:1.4rem}
+.kpis{display:grid;grid-template-columns:repeat(auto-fit,minmax(180px,1fr));gap:10px;margin:1rem 0}
+.card{border:1px solid #e5e7eb;border-radius:14px;padding:10px 14px}.card b{color:#475569;display:block;font-size:.85rem}
+.badge{display:inline-block;padding:4px 10px;border-radius:999px;font-weight:700;font-size:.85rem;background:rgba(20,184,166,.12)}
+.radar{display:block;margin:0 auto}small{color:#64748B}li{margin-bottom:.2rem}"""
+
+
+def slug(texto: str) -> str:
+    """Nombre de archivo portable: sin acentos, minúsculas y guiones."""
+    s = unicodedata.normalize('NFKD', str(texto)).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', s.lower()).strip('-') or 'sin-nombre'
+
+
+def career_contexts(df: pd.DataFrame, carreras=None, col_car: str = COL_CAR,
+                    col_nom: str = COL_NOM) -> dict:
+    """career_context de cada carrera (todas, o solo `carreras`), calculado una vez."""
+    with perf.stage('career_contexts', rows=len(df)):
+        grupos = df.groupby(df[col_car].astype(str), observed=True, sort=True).indices
+        if carreras is not None:
+            grupos = {c: grupos[c] for c in carreras if c in grupos}
+        return {c: career_context(df.iloc[filas], col_nom) for c, filas in grupos.items()}
+
+
+def radar_svg(valores, referencia, lado: int = 300) -> str:
+    """Radar de los 7 TOTAL_* del estudiante (azul) frente a la referencia (verde)."""
+    c, r = lado / 2, lado / 2 - 34
+    ang = [-math.pi / 2 + 2 * math.pi * k / len(AREAS) for k in range(len(AREAS))]
+
+    def punto(k, frac):
+        return c + r * frac * math.cos(ang[k]), c + r * frac * math.sin(ang[k])
+
+    def poligono(vals):
+        return ' '.join('%.1f,%.1f' % punto(k, min(float(v) / _MAX_AREA[a], 1.0))
+                        for k, (a, v) in enumerate(zip(AREAS, vals)))
+
+    partes = [f'<svg class="radar" xmlns="http://www.w3.org/2000/svg" width="{lado}" height="{lado}" '
+              f'viewBox="0 0 {lado} {lado}" role="img" aria-label="Radar CHASIDE">']
+    for frac in (0.25, 0.5, 0.75, 1.0):
+        partes.append(f'<polygon points="{poligono([frac * _MAX_AREA[a] for a in AREAS])}" '
+                      'fill="none" stroke="#e5e7eb"/>')
+    for k, a in enumerate(AREAS):
+        x, y = punto(k, 1.0)
+        lx, ly = punto(k, 1.13)
+        partes.append(f'<line x1="{c}" y1="{c}" x2="{x:.1f}" y2="{y:.1f}" stroke="#e5e7eb"/>'
+                      f'<text x="{lx:.1f}" y="{ly:.1f}" text-anchor="middle" dominant-baseline="middle" '
+                      f'font-size="13" font-weight="700" fill="#475569">{a}</text>')
+    partes.append(f'<polygon points="{poligono(referencia)}" fill="rgba(34,197,94,.15)" '
+                  'stroke="#22c55e" stroke-dasharray="4 3"/>')
+    partes.append(f'<polygon points="{poligono(valores)}" fill="rgba(59,130,246,.25)" stroke="#3b82f6" '
+                  'stroke-width="2"/></svg>')
+    return ''.join(partes)
+
+
+def _coherencia(area: str, carrera: str) -> str:
+    perfil = PERFIL_CARRERAS.get(carrera, {})
+    if area in perfil.get('Fuerte', []):
+        return "Coherente"
+    if area in perfil.get('Baja', []):
+        return "Requiere orientación"
+    return "Neutral"
+
+
+def _lista(diffs: list, signo: str, vacio: str) -> str:
+    if not diffs:
+        return f'<p><small>{vacio}</small></p>'
+    items = ''.join(f'<li><b>{a}</b> ({signo}{abs(d):.2f}) — {_DESC[a]}</li>' for a, d in diffs)
+    return f'<ul>{items}</ul>'
+
+
+def student_html(rep: dict, totales, referencia) -> str:
+    """HTML de un estudiante a partir de su fila de career_report, sus TOTAL_*
+    y el vector de referencia de la carrera (ambos en el orden de AREAS)."""
+    diff = [(a, float(t) - float(r)) for a, t, r in zip(AREAS, totales, referencia)]
+    fortalezas = sorted((x for x in diff if x[1] > 0), key=lambda x: -x[1])
+    oportunidades = sorted((x for x in diff if x[1] < 0), key=lambda x: x[1])
+    area, carrera = rep["Área fuerte CHASIDE"], rep["Carrera"]
+    sugeridas = SUGERIDAS_POR_AREA.get(area, [])
+    color = _COLORES_IND.get(rep["Indicador"], "#475569")
+    e = lambda v: escape(str(v))   # noqa: E731
+
+    kpis = ''.join(f'<div class="card"><b>{k}</b>{v}</div>' for k, v in (
+        ("Nombre del estudiante", e(rep["Nombre"])),
+        ("Carrera", e(carrera)),
+        ("Categoría identificada", f'<span style="color:#3b82f6;font-weight:700">{e(rep["Categoría"])}</span>'),
+        ("Nº en esta categoría", f'{rep["N en categoría (carrera)"]} ({rep["% en categoría (carrera)"]:.1f}%)'),
+    ))
+    return (
+        f'<!DOCTYPE html><html lang="es"><head><meta charset="utf-8">'
+        f'<title>Reporte CHASIDE – {e(rep["Nombre"])}</title><style>{_CSS}</style></head><body>'
+        f'<h1>🧾 Reporte ejecutivo individual</h1><small>CHASIDE • {e(carrera)}</small>'
+        f'<div class="kpis">{kpis}</div>'
+        f'<span class="badge" style="color:{color}">Indicador: {e(rep["Indicador"])}</span>'
+        f'<h2>🕸️ Perfil CHASIDE</h2>{radar_svg(totales, referencia)}'
+        f'<p style="text-align:center"><small><span style="color:#3b82f6">■</span> Estudiante &nbsp; '
+        f'<span style="color:#22c55e">■</span> Referencia Verde de la carrera</small></p>'
+        f'<h2>✅ Fortalezas destacadas</h2>'
+        + _lista(fortalezas, '+', "No se observan dimensiones por encima del promedio de referencia del grupo.")
+        + '<h2>🛠️ Áreas de oportunidad</h2>'
+        + _lista(oportunidades, '−', "El estudiante no presenta brechas importantes respecto al grupo.")
+        + f'<h2>🎯 Coherencia vocacional y afinidades</h2><ul><li><b>Área fuerte (CHASIDE):</b> {e(area)}</li>'
+        f'<li><b>Coherencia con la carrera elegida:</b> {_coherencia(area, carrera)}</li></ul>'
+        f'<h2>📚 Carreras con mayor afinidad al perfil</h2>'
+        + (f'<ul>{"".join(f"<li>{e(c)}</li>" for c in sugeridas)}</ul>' if sugeridas
+           else '<p><small>No se identificaron carreras afines basadas en el área fuerte.</small></p>')
+        + '</body></html>'
+    )
+
+
+def render_block(filas: pd.DataFrame, carrera: str, col_nom: str, ctx: dict) -> list:
+    """Tarea del pool: [(nombre, html utf-8)] de un bloque de estudiantes de una carrera."""
+    rep = career_report(filas, carrera, col_nom, filas=filas, ctx=ctx)
+    totales = filas[REF_COLS].to_numpy(dtype=float).tolist()
+    ref = ctx['ref_vec'].to_numpy(dtype=float).tolist()
+    return [(r["Nombre"], student_html(r, totales[i], ref).encode('utf-8'))
+            for i, r in enumerate(rep.to_dict('records'))]
+
+
+def _tareas(df, contextos, col_car, col_nom, bloque):
+    cols = list(dict.fromkeys([col_nom, col_car, 'Categoría_UI', 'Score', 'Area_Fuerte_Ponderada', *REF_COLS]))
+    grupos = df.groupby(df[col_car].astype(str), observed=True, sort=True).indices
+    for carrera, ctx in contextos.items():
+        filas = grupos[carrera]
+        for ini in range(0, len(filas), bloque):
+            # solo las columnas que usa el reporte viajan al proceso hijo
+            yield carrera, (df.iloc[filas[ini:ini + bloque]][cols], carrera, col_nom, ctx)
+
+
+def write_reports(df: pd.DataFrame, destino, carreras=None, col_car: str = COL_CAR,
+                  col_nom: str = COL_NOM, workers: int = None, bloque: int = BLOQUE) -> int:
+    """Escribe en `destino` (ruta o archivo binario) un zip con un HTML por
+    estudiante: carrera/nombre.html. Devuelve el número de reportes."""
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    contextos = career_contexts(df, carreras, col_car, col_nom)
+    usados, n = set(), 0
+
+    def guardar(zf, carrera, reportes):
+        nonlocal n
+        for nombre, datos in reportes:
+            ruta = f'{slug(carrera)}/{slug(nombre)}.html'
+            k = 2
+            while ruta in usados:         # homónimos en la misma carrera
+                ruta = f'{slug(carrera)}/{slug(nombre)}-{k}.html'; k += 1
+            usados.add(ruta)
+            zf.writestr(ruta, datos)
+            n += 1
+
+    # nivel 1: el zip se comprime en el proceso principal y casi no pierde tamaño frente a 6
+    with perf.stage('html_reports', rows=len(df)), \
+            zipfile.ZipFile(destino, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        tareas = _tareas(df, contextos, col_car, col_nom, bloque)
+        if workers <= 1:
+            for carrera, args in tareas:
+                guardar(zf, carrera, render_block(*args))
+            return n
+        # spawn: el dashboard tiene hilos vivos y fork podría heredar locks tomados
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as ex:
+            pendientes = deque()
+            for carrera, args in tareas:
+                pendientes.append((carrera, ex.submit(render_block, *args)))
+                if len(pendientes) >= 2 * workers:
+                    c, fut = pendientes.popleft()
+                    guardar(zf, c, fut.result())
+            while pendientes:
+                c, fut = pendientes.popleft()
+                guardar(zf, c, fut.result())
+    return n
+
+
+def main(argv=None) -> int:
+    from .io import read_answers
+    from .pipeline import process_chaside
+
+    ap = argparse.ArgumentParser(prog='python -m chaside.html_report',
+                                 description='Reportes individuales CHASIDE en HTML, empaquetados en un zip.')
+    ap.add_argument('entrada', help='respuestas: CSV (ruta local o URL), .parquet o .feather/.arrow')
+    ap.add_argument('-o', '--salida', required=True, help='archivo .zip de salida')
+    ap.add_argument('--carrera', action='append', help='limitar a esta carrera (se puede repetir)')
+    ap.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                    help='procesos de renderizado (default: núcleos disponibles)')
+    ap.add_argument('--bloque', type=int, default=BLOQUE, help=f'estudiantes por tarea (default: {BLOQUE})')
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    df, col_car, col_nom = process_chaside(read_answers(args.entrada))
+    n = write_reports(df, args.salida, args.carrera, col_car, col_nom, args.workers, args.bloque)
+    print(f"✔ {n} reportes → {args.salida} ({time.perf_counter() - t0:.1f} s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+# ============================================================
+# CHASIDE • Índice de estudiantes (carrera → filas, nombre → fila)
+# ============================================================
+# Se construye una vez por dataset procesado. Seleccionar carrera o
+# estudiante ya no recorre el frame completo, y el buscador devuelve un
+# número acotado de coincidencias sin recorrer todos los nombres:
+#   1. prefijo del nombre completo: búsqueda binaria sobre los nombres
+#      normalizados ordenados;
+#   2. inicio de cualquier palabra ("perez" encuentra "juan perez lopez"):
+#      búsqueda binaria sobre los sufijos que empiezan en cada palabra
+#      (se arman la primera vez que se busca en la carrera);
+#   3. subcadena a mitad de palabra: recorrido lineal por bloques, solo con
+#      consultas de MIN_SUBCADENA caracteres o más y solo hasta completar el
+#      límite. Es el único paso O(n); sus coincidencias no se cuentan más
+#      allá de las que se muestran.
+
+import numpy as np
+import pandas as pd
+
+MIN_SUBCADENA = 3          # caracteres mínimos para el recorrido por subcadena
+BLOQUE_SUBCADENA = 8192    # nombres por bloque del recorrido (se detiene al llenar el límite)
+
+
+def normalize_names(nombres: pd.Series) -> pd.Series:
+    """minúsculas, sin acentos y con espacios colapsados (vectorizado)."""
+    return (nombres.astype(str).str.normalize('NFKD')
+            .str.encode('ascii', 'ignore').str.decode('ascii')
+            .str.lower().str.split().str.join(' '))
+
+
+class _Carrera:
+    __slots__ = ('filas', 'fila_por_nombre', 'nombres', 'norm', '_palabras')
+
+    def __init__(self, filas: np.ndarray, nombres: np.ndarray):
+        self.filas = filas
+        s = pd.Series(filas, index=nombres)
+        s = s[~s.index.duplicated()]            # primera aparición, como antes
+        self.fila_por_nombre = dict(zip(s.index, s.to_numpy()))
+        norm = normalize_names(pd.Series(s.index))
+        orden = np.argsort(norm.to_numpy(dtype=object), kind='stable')
+        self.nombres = s.index.to_numpy(dtype=object)[orden]     # para mostrar
+        self.norm = norm.to_numpy(dtype=object)[orden]           # para buscar
+        self._palabras = None
+
+    def palabras(self):
+        """(sufijos desde cada palabra después de la primera, ordenados; posición
+        del nombre en self.nombres). La primera palabra ya la cubre el prefijo."""
+        if self._palabras is None:
+            sufijos, pos = [], []
+            for i, n in enumerate(self.norm):
+                k = n.find(' ')
+                while k >= 0:
+                    sufijos.append(n[k + 1:])
+                    pos.append(i)
+                    k = n.find(' ', k + 1)
+            sufijos = np.array(sufijos, dtype=object)
+            orden = np.argsort(sufijos, kind='stable')
+            self._palabras = (sufijos[orden], np.array(pos, dtype=np.intp)[orden])
+        return self._palabras
+
+
+class StudentIndex:
+    def __init__(self, df: pd.DataFrame, col_car: str, col_nom: str):
+        car = df[col_car].astype('category').cat
+        codes = car.codes.to_numpy()
+        orden = np.argsort(codes, kind='stable')                # filas en orden del frame
+        cortes = np.cumsum(np.bincount(codes[codes >= 0], minlength=len(car.categories)))
+        inicio = np.searchsorted(codes[orden], 0)               # salta NA (código -1)
+        nombres = df[col_nom].astype(str).to_numpy(dtype=object)
+
+        self._carreras = {}
+        prev = inicio
+        for c, fin in zip(car.categories, cortes + inicio):
+            if fin > prev:
+                filas = orden[prev:fin]
+                self._carreras[str(c)] = _Carrera(filas, nombres[filas])
+            prev = fin
+        self.carreras = sorted(self._carreras)
+
+    def rows(self, carrera: str) -> np.ndarray:
+        """Posiciones (iloc) de los estudiantes de la carrera."""
+        c = self._carreras.get(carrera)
+        return c.filas if c is not None else np.empty(0, dtype=np.intp)
+
+    def n_students(self, carrera: str) -> int:
+        c = self._carreras.get(carrera)
+        return len(c.nombres) if c is not None else 0
+
+    def row_of(self, carrera: str, nombre: str):
+        """Posición (iloc) del estudiante, o None."""
+        c = self._carreras.get(carrera)
+        return None if c is None else c.fila_por_nombre.get(nombre)
+
+    def search(self, carrera: str, consulta: str, limite: int = 50):
+        """(nombres coincidentes, total de coincidencias). Primero por prefijo,
+        luego por inicio de palabra y al final por subcadena; como máximo
+        `limite` nombres. El total incluye todas las coincidencias por prefijo
+        y por palabra, y solo las de subcadena que se alcanzaron a mostrar."""
+        c = self._carreras.get(carrera)
+        if c is None:
+            return [], 0
+        q = normalize_names(pd.Series([consulta])).iat[0]
+        if not q:
+            return list(c.nombres[:limite]), len(c.nombres)
+        # ⚡ prefijo del nombre y de cada palabra: rangos contiguos en arreglos ordenados
+        lo = np.searchsorted(c.norm, q, side='left')
+        hi = np.searchsorted(c.norm, q + '\uffff', side='left')
+        sufijos, pos = c.palabras()
+        plo = np.searchsorted(sufijos, q, side='left')
+        phi = np.searchsorted(sufijos, q + '\uffff', side='left')
+        vistos = np.zeros(len(c.norm), dtype=bool)
+        vistos[lo:hi] = True
+        por_palabra = np.unique(pos[plo:phi])
+        por_palabra = por_palabra[~vistos[por_palabra]]
+        total = (hi - lo) + len(por_palabra)
+        res = list(c.nombres[lo:hi][:limite])
+        res += list(c.nombres[por_palabra[:max(limite - len(res), 0)]])
+        if len(res) >= limite or len(q) < MIN_SUBCADENA:
+            return res, int(total)
+        vistos[por_palabra] = True
+
+        # subcadena a mitad de palabra: lineal, por bloques y solo hasta llenar el límite
+        for ini in range(0, len(c.norm), BLOQUE_SUBCADENA):
+            bloque = pd.Series(c.norm[ini:ini + BLOQUE_SUBCADENA])
+            hits = np.flatnonzero(bloque.str.contains(q, regex=False).to_numpy()) + ini
+            hits = hits[~vistos[hits]][:limite - len(res)]
+            res += list(c.nombres[hits])
+            total += len(hits)
+            if len(res) >= limite:
+                break
+        return res, int(total)
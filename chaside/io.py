@@ -0,0 +1,167 @@
+# ============================================================
+# CHASIDE • Lectura de respuestas (sin Streamlit)
+# ============================================================
+# CSV, Parquet y Arrow/Feather. Los formatos columnares se leen con mapeo
+# a memoria y proyección: solo se materializan la marca temporal, los 98
+# ítems, la carrera y el nombre. Los ítems guardados como texto llegan
+# codificados en diccionario (categóricos) y los guardados como 0/1 o
+# booleanos llegan tal cual, así que normalize_answers no toca cadenas.
+# pyarrow se importa solo al leer esos formatos (import diferido: quien
+# lee CSV no lo carga).
+
+import hashlib
+import io
+import os
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+from . import perf
+from .constants import COL_CAR, COL_NOM, N_ITEMS, N_META
+
+TIMEOUT_S = 60
+EXT_PARQUET = ('.parquet', '.pq')
+EXT_ARROW = ('.feather', '.arrow', '.ipc')
+_MAGIC_PARQUET, _MAGIC_ARROW = b'PAR1', b'ARROW1'
+
+
+def fetch_bytes(url: str, timeout: float = TIMEOUT_S) -> bytes:
+    """Contenido crudo de una URL http(s) o de una ruta local."""
+    if str(url).startswith(('http://', 'https://')):
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.read()
+    with open(url, 'rb') as fh:
+        return fh.read()
+
+
+def parse_answers(crudo: bytes) -> pd.DataFrame:
+    """Bytes de un CSV, Parquet o Arrow/Feather de respuestas → DataFrame crudo.
+    df.attrs['sha256'] guarda el hash de los bytes (clave de la caché de disco)."""
+    if crudo[:4] == _MAGIC_PARQUET or crudo[:6] == _MAGIC_ARROW:
+        df = read_columnar(crudo)
+    else:
+        with perf.stage('parse_csv') as reg:
+            df = pd.read_csv(io.BytesIO(crudo))
+            if reg is not None:
+                reg['rows'] = len(df)
+        df.columns = [str(c) for c in df.columns]
+    df.attrs['sha256'] = sha256(crudo)
+    return df
+
+
+def sha256(crudo: bytes) -> str:
+    return hashlib.sha256(crudo).hexdigest()
+
+
+def read_answers(url: str) -> pd.DataFrame:
+    """Respuestas (URL de Google Sheets o ruta local; CSV, Parquet o Arrow) → DataFrame crudo.
+    Las rutas locales columnares se mapean a memoria en lugar de leerse completas."""
+    with perf.stage('load_csv'):
+        if is_columnar(url) and os.path.exists(url):
+            return read_columnar(url)
+        return parse_answers(fetch_bytes(url))
+
+
+# ---------- formatos columnares ----------
+
+def is_columnar(ruta) -> bool:
+    return str(ruta).lower().endswith(EXT_PARQUET + EXT_ARROW)
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:   # está en requirements.txt; solo falta en instalaciones mínimas
+        raise ImportError("Parquet/Arrow requieren 'pyarrow' (pip install pyarrow).") from e
+    return pa
+
+
+def _es_parquet(fuente) -> bool:
+    if isinstance(fuente, (bytes, bytearray, memoryview)):
+        return bytes(fuente[:4]) == _MAGIC_PARQUET
+    return str(fuente).lower().endswith(EXT_PARQUET)
+
+
+def _origen(fuente):
+    """Archivo Arrow de solo lectura: bytes sin copia o ruta mapeada a memoria."""
+    pa = _pyarrow()
+    if isinstance(fuente, (bytes, bytearray, memoryview)):
+        return pa.BufferReader(pa.py_buffer(fuente))
+    return pa.memory_map(str(fuente), 'r')
+
+
+def _es_texto(tipo) -> bool:
+    pa = _pyarrow()
+    return pa.types.is_string(tipo) or pa.types.is_large_string(tipo)
+
+
+def _parquet(fuente, proyectar: bool):
+    """(ParquetFile, nombres del esquema, columnas a leer). Los ítems de texto
+    se piden como diccionario: llegan como códigos, no como cadenas."""
+    import pyarrow.parquet as pq
+    esquema = pq.read_schema(_origen(fuente))
+    nombres = esquema.names
+    items = nombres[N_META:N_META+N_ITEMS] if proyectar else []
+    archivo = pq.ParquetFile(_origen(fuente),
+                             read_dictionary=[c for c in items if _es_texto(esquema.field(c).type)])
+    return archivo, nombres, (answer_columns(nombres) if proyectar else nombres)
+
+
+def _arrow(fuente, proyectar: bool):
+    """(tabla proyectada, nombres del esquema): sin copias si el archivo no está comprimido."""
+    tabla = _pyarrow().ipc.open_file(_origen(fuente)).read_all()
+    nombres = tabla.schema.names
+    return (tabla.select(answer_columns(nombres)) if proyectar else tabla), nombres
+
+
+def answer_columns(nombres: list) -> list:
+    """Proyección para calificar: marca temporal, ítems, carrera y nombre."""
+    proy = [nombres[0], *nombres[N_META:N_META+N_ITEMS], COL_CAR, COL_NOM]
+    return [c for c in dict.fromkeys(proy) if c in nombres]
+
+
+def _a_pandas(tabla, nombres: list) -> pd.DataFrame:
+    """Tabla proyectada → frame con el orden posicional del formulario. Los
+    metadatos no leídos quedan como categóricos vacíos (1 byte por fila)."""
+    import pyarrow.compute as pc
+    items = set(nombres[N_META:N_META+N_ITEMS])
+    for i, campo in enumerate(tabla.schema):
+        if campo.name in items and _es_texto(campo.type):
+            tabla = tabla.set_column(i, campo.name, pc.dictionary_encode(tabla.column(i)))
+    df = tabla.to_pandas(split_blocks=True)
+    vacia = pd.Categorical.from_codes(np.full(len(df), -1, np.int8), categories=pd.Index([], dtype=object))
+    for c in nombres[1:N_META]:
+        if c not in df.columns:
+            df[c] = vacia
+    orden = [c for c in nombres if c in df.columns]
+    return df[orden]
+
+
+def read_columnar(fuente, todas: bool = False) -> pd.DataFrame:
+    """Parquet o Arrow/Feather (ruta o bytes) → DataFrame crudo con solo las
+    columnas que usa el pipeline (todas=True: sin proyección)."""
+    with perf.stage('read_columnar') as reg:
+        if _es_parquet(fuente):
+            archivo, nombres, proy = _parquet(fuente, not todas)
+            tabla = archivo.read(columns=proy)
+        else:
+            tabla, nombres = _arrow(fuente, not todas)
+        df = tabla.to_pandas() if todas else _a_pandas(tabla, nombres)
+        if reg is not None:
+            reg['rows'] = len(df)
+    df.columns = [str(c) for c in df.columns]
+    return df
+
+
+def iter_columnar(ruta: str, chunksize: int):
+    """Bloques proyectados de `chunksize` filas de un Parquet/Arrow (streaming)."""
+    pa = _pyarrow()
+    if _es_parquet(ruta):
+        archivo, nombres, proy = _parquet(ruta, True)
+        lotes = archivo.iter_batches(batch_size=chunksize, columns=proy)
+    else:
+        tabla, nombres = _arrow(ruta, True)
+        lotes = tabla.to_batches(max_chunksize=chunksize)
+    for lote in lotes:
+        yield _a_pandas(pa.Table.from_batches([lote]), nombres)
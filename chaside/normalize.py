@@ -0,0 +1,72 @@
+# ============================================================
+# CHASIDE • Normalización de respuestas Sí/No
+# ============================================================
+# El bloque de ítems tiene muy pocos valores distintos: cada columna se
+# factoriza sobre su arreglo nativo, cada token único se traduce a
+# 0/1/inválido UNA vez (memo compartido) y la matriz uint8 se llena por
+# indexado. El costo depende del número de tokens distintos,
+# no de operaciones de cadena por celda.
+
+import numpy as np
+import pandas as pd
+
+TOKENS_SI = {'sí', 'si', 's', '1', 'true', 'verdadero', 'x'}
+TOKENS_NO = {'no', 'n', '0', 'false', 'falso', '', 'nan'}
+INVALIDO = 255
+
+
+def token_value(token) -> int:
+    """Token crudo → 1 (Sí), 0 (No) o INVALIDO."""
+    t = str(token).strip().lower()
+    if t in TOKENS_SI:
+        return 1
+    if t in TOKENS_NO:
+        return 0
+    try:                      # '1.0', '0.0' (columnas leídas como float)
+        v = float(t)
+    except ValueError:
+        return INVALIDO
+    return int(v) if v in (0.0, 1.0) else INVALIDO
+
+
+def normalize_answers(block: pd.DataFrame):
+    """Bloque de respuestas (N×98, cualquier dtype) → (matriz uint8 0/1,
+    {token no reconocido: conteo}). Los tokens no reconocidos cuentan como 0."""
+    out = np.empty(block.shape, dtype=np.uint8)
+    memo = {}
+    invalidos = {}
+    for j in range(block.shape[1]):
+        col = block.iloc[:, j]
+        if isinstance(col.dtype, np.dtype) and col.dtype.kind in 'biu':
+            # ⚡ ítems ya numéricos/booleanos (Parquet/Arrow): sin factorizar
+            _copiar_numerica(col.to_numpy(), out[:, j], invalidos)
+            continue
+        codes, uniques = pd.factorize(col, use_na_sentinel=True)
+        vals = []
+        for u in uniques:
+            if u not in memo:
+                memo[u] = token_value(u)
+            vals.append(memo[u])
+        # el último lugar de la tabla es para NA (código -1)
+        lut = np.array(vals + [0], dtype=np.uint8)
+        malos = np.flatnonzero(lut == INVALIDO)
+        if malos.size:
+            conteo = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            for k in malos:
+                t = str(uniques[k])
+                invalidos[t] = invalidos.get(t, 0) + int(conteo[k])
+            lut[malos] = 0
+        out[:, j] = lut[codes]
+    return out, invalidos
+
+
+def _copiar_numerica(v: np.ndarray, destino: np.ndarray, invalidos: dict):
+    """Columna bool/entera → 0/1 en `destino`; valores fuera de {0, 1} cuentan como 0."""
+    if v.dtype.kind == 'b':
+        destino[:] = v
+        return
+    ok = (v == 0) | (v == 1)
+    if not ok.all():
+        for t, n in zip(*np.unique(v[~ok], return_counts=True)):
+            invalidos[str(t)] = invalidos.get(str(t), 0) + int(n)
+    destino[:] = np.where(ok, v, 0)
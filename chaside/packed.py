@@ -0,0 +1,56 @@
+# ============================================================
+# CHASIDE • Respuestas empaquetadas en bits (13 bytes por estudiante)
+# ============================================================
+# Las 98 respuestas 0/1 se guardan con np.packbits en 13 bytes (8× menos
+# memoria que 98 columnas uint8). Las sumas por área y la coincidencia
+# salen de popcounts vectorizados sobre el arreglo empaquetado con
+# máscaras de bits por área precalculadas.
+
+import numpy as np
+import pandas as pd
+
+from .constants import N_ITEMS
+from .scoring import W_APTITUD, W_INTERES
+
+N_BYTES = (N_ITEMS + 7) // 8          # 13
+COLS_BITS = [f'BITS_{k:02d}' for k in range(N_BYTES)]
+
+# máscaras (7 × 13) por área: bit del ítem i encendido si pertenece al área
+MASK_INTERES = np.packbits(W_INTERES.T.astype(np.uint8), axis=1)
+MASK_APTITUD = np.packbits(W_APTITUD.T.astype(np.uint8), axis=1)
+
+if hasattr(np, 'bitwise_count'):      # numpy ≥ 2.0
+    _popcount = np.bitwise_count
+else:
+    _POP_LUT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def _popcount(a):
+        return _POP_LUT[a]
+
+
+def pack_items(items: np.ndarray) -> np.ndarray:
+    """(N×98 uint8 0/1) → (N×13 uint8)."""
+    return np.packbits(np.asarray(items, dtype=np.uint8), axis=1)
+
+
+def _sumas_mascaras(packed: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    out = np.empty((packed.shape[0], len(masks)), dtype=np.uint8)
+    for j, m in enumerate(masks):
+        out[:, j] = _popcount(packed & m).sum(axis=1, dtype=np.uint8)
+    return out
+
+
+def sumas_por_area_packed(packed: np.ndarray):
+    """Equivalente a scoring.sumas_por_area sobre el arreglo empaquetado."""
+    return _sumas_mascaras(packed, MASK_INTERES), _sumas_mascaras(packed, MASK_APTITUD)
+
+
+def coincidencia_packed(packed: np.ndarray) -> np.ndarray:
+    """Equivalente a scoring.coincidencia: proporción de la respuesta mayoritaria."""
+    pct_si = _popcount(packed).sum(axis=1, dtype=np.int64) / N_ITEMS
+    return np.maximum(pct_si, 1 - pct_si).astype(np.float32)
+
+
+def packed_frame(packed: np.ndarray, index=None) -> pd.DataFrame:
+    """Arreglo empaquetado como 13 columnas uint8 (BITS_00..BITS_12)."""
+    return pd.DataFrame(packed, index=index, columns=COLS_BITS)
@@ -0,0 +1,27 @@
+# ============================================================
+# CHASIDE • Rutas de datos locales (sin dependencias pesadas)
+# ============================================================
+# Directorio del histórico y listado de sus cohortes usando solo `os`: la
+# barra lateral los consulta en cada rerun, también en las páginas que no
+# cargan pandas.
+#
+#   CHASIDE_HISTORY_DIR   directorio raíz del histórico (default: ~/.local/share/chaside/historico)
+
+import os
+
+from .constants import COL_COHORTE
+
+
+def history_dir() -> str:
+    return os.environ.get('CHASIDE_HISTORY_DIR',
+                          os.path.join(os.path.expanduser('~'), '.local', 'share', 'chaside', 'historico'))
+
+
+def saved_cohorts(raiz: str = None) -> list:
+    """Cohortes guardadas en el histórico (directorios Cohorte=AAAA), en orden."""
+    raiz = raiz or history_dir()
+    if not os.path.isdir(raiz):
+        return []
+    prefijo = f'{COL_COHORTE}='
+    return sorted(int(n[len(prefijo):]) for n in os.listdir(raiz)
+                  if n.startswith(prefijo) and n[len(prefijo):].isdigit())
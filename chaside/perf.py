@@ -0,0 +1,105 @@
+# ============================================================
+# CHASIDE • Instrumentación por etapas (tiempo, filas, memoria)
+# ============================================================
+# Desactivada por defecto: `stage()` devuelve un contexto nulo compartido y
+# `timed` solo consulta una bandera. Activada (CHASIDE_PROFILE=1 o el panel
+# de administración), cada etapa registra tiempo de pared, filas y delta de
+# RSS, y emite una línea JSON en el logger 'chaside.perf'.
+#
+#   with perf.stage('cleaning', rows=len(df)): ...
+#   @perf.timed('render_info_general')
+
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+log = logging.getLogger('chaside.perf')
+
+_DEFAULT = os.environ.get('CHASIDE_PROFILE', '') not in ('', '0')
+_local = threading.local()          # cada rerun de Streamlit corre en su propio hilo
+_NULL = contextlib.nullcontext()
+
+try:
+    _PAGE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGE = None
+
+
+def enable(flag: bool = True):
+    _local.activo = bool(flag)
+    if flag and not log.handlers:          # líneas JSON a stderr, una por etapa
+        h = logging.StreamHandler()
+        h.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(h)
+        log.setLevel(logging.INFO)
+
+
+def enabled() -> bool:
+    return getattr(_local, 'activo', _DEFAULT)
+
+
+def reset():
+    _local.registros = []
+
+
+def records() -> list:
+    """Registros de etapas del hilo actual (orden de inicio)."""
+    return list(getattr(_local, 'registros', []))
+
+
+def rss_mb():
+    """RSS actual en MB (Linux, /proc); None si no está disponible."""
+    if _PAGE is None:
+        return None
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * _PAGE / 2**20
+    except OSError:
+        return None
+
+
+@contextlib.contextmanager
+def _medir(nombre, rows):
+    prof = getattr(_local, 'prof', 0)
+    _local.prof = prof + 1
+    # se registra al entrar para que las etapas anidadas queden bajo su padre
+    reg = {'stage': nombre, 'depth': prof, 'ms': None, 'rows': rows, 'mem_delta_mb': None}
+    if not hasattr(_local, 'registros'):
+        _local.registros = []
+    _local.registros.append(reg)
+    m0 = rss_mb()
+    t0 = time.perf_counter()
+    try:
+        yield reg
+    finally:
+        reg['ms'] = round((time.perf_counter() - t0) * 1000, 2)
+        m1 = rss_mb()
+        _local.prof = prof
+        if m0 is not None and m1 is not None:
+            reg['mem_delta_mb'] = round(m1 - m0, 2)
+        log.info(json.dumps(reg, ensure_ascii=False))
+
+
+def stage(nombre: str, rows: int = None):
+    """Contexto que mide una etapa; costo ~nulo si la instrumentación está apagada.
+    Produce el registro (dict) o None, por si las filas se conocen al final."""
+    return _medir(nombre, rows) if enabled() else _NULL
+
+
+def timed(nombre: str = None):
+    """Decorador: mide cada llamada a la función como una etapa."""
+    def deco(fn):
+        etiqueta = nombre or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled():
+                return fn(*args, **kwargs)
+            with _medir(etiqueta, None):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
@@ -0,0 +1,100 @@
+# ============================================================
+# CHASIDE • Pipeline completo (sin Streamlit)
+# ============================================================
+# limpieza Sí/No → coincidencia → sumas por área → ponderación →
+# clasificación → categoricals. Lo usan el dashboard y los procesos batch.
+
+import pandas as pd
+
+from . import perf
+from .classify import area_codes, classify
+from .constants import COL_CAR, COL_NOM, N_ITEMS, N_META
+from .normalize import normalize_answers
+from .packed import coincidencia_packed, pack_items, packed_frame, sumas_por_area_packed
+from .scoring import coincidencia, score_sums, sumas_por_area
+
+# Sube esta versión cuando cambie cualquier regla de calificación: invalida
+# los resultados guardados en la caché de disco (chaside.cache).
+SCORING_VERSION = '2025.1'
+
+
+def process_chaside(df_raw: pd.DataFrame, packed: bool = False):
+    """DataFrame crudo del formulario → (df procesado, col_car, col_nom).
+
+    Con packed=True las 98 columnas de ítems se reemplazan por 13 columnas
+    uint8 de bits empaquetados (BITS_00..BITS_12, ver chaside.packed) y las
+    sumas por área se calculan con popcounts.
+    """
+    n = len(df_raw)
+    with perf.stage('process_chaside', rows=n):
+        return _process(df_raw, packed, n)
+
+
+def _process(df_raw, packed, n):
+    df = df_raw.copy()
+
+    col_car, col_nom = COL_CAR, COL_NOM
+    if col_car not in df.columns or col_nom not in df.columns:
+        raise ValueError(f"Faltan columnas: '{col_car}', '{col_nom}'")
+
+    # a string + categoricals (⚡ menos memoria y más rápidos los groupby)
+    df[col_car] = df[col_car].astype('string')
+    df[col_nom] = df[col_nom].astype('string')
+
+    cols_items = df.columns[N_META:N_META+N_ITEMS]
+    if len(cols_items) != N_ITEMS:
+        raise ValueError(f"Se esperaban {N_ITEMS} columnas de ítems; hay {len(cols_items)}")
+
+    # ⚡ Sí/No → 1/0: factorización única del bloque (chaside.normalize)
+    with perf.stage('cleaning', rows=n):
+        items, invalidos = normalize_answers(df[cols_items])
+        if packed:
+            bits = pack_items(items)
+            del items
+            bloque = packed_frame(bits, index=df.index)
+        else:
+            bloque = pd.DataFrame(items, index=df.index, columns=cols_items)
+        df = pd.concat([df.iloc[:, :N_META], bloque, df.iloc[:, N_META+N_ITEMS:]], axis=1)
+
+    # Coincidencia (sesgo)
+    with perf.stage('coincidence', rows=n):
+        df['Coincidencia'] = coincidencia_packed(bits) if packed else coincidencia(items)
+
+    # ⚡ sumas por área: un producto matricial (o popcounts)
+    with perf.stage('area_sums', rows=n):
+        interes, aptitud = sumas_por_area_packed(bits) if packed else sumas_por_area(items)
+
+    # ponderación, área fuerte, Score y totales en un solo concat (chaside.scoring)
+    with perf.stage('weighting', rows=n):
+        df = pd.concat([df, score_sums(interes, aptitud, index=df.index)], axis=1)
+
+    # ⚡ Clasificación por tablas (área × carrera) con códigos enteros:
+    #    coherencia, carrera mejor perfilada, diagnóstico, semáforo y etiqueta UI
+    with perf.stage('classification', rows=n):
+        clasif = classify(df['Coincidencia'].to_numpy(), area_codes(df['Area_Fuerte_Ponderada']), df[col_car])
+        df = pd.concat([df, clasif], axis=1)
+
+    # categoricals (⚡)
+    with perf.stage('categorical', rows=n):
+        df[col_car] = df[col_car].astype('category')   # ⚡ groupby más rápido
+        df[col_nom] = df[col_nom].astype('string')
+
+    df.attrs['respuestas_invalidas'] = invalidos   # {token: conteo}
+    return df, col_car, col_nom
+
+
+def restore_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Categorías como en una calificación completa, tras concatenar frames
+    ya calificados (pd.concat las degrada a object si no coinciden)."""
+    df[COL_CAR] = df[COL_CAR].astype('string').astype('category')
+    df['Area_Fuerte_Ponderada'] = df['Area_Fuerte_Ponderada'].astype(object).astype('category')
+    return df
+
+
+def merge_invalid(conteos) -> dict:
+    """Suma varios {token: conteo} de respuestas_invalidas."""
+    invalidos = {}
+    for c in conteos:
+        for token, n in c.items():
+            invalidos[token] = invalidos.get(token, 0) + n
+    return invalidos
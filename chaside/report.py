@@ -0,0 +1,71 @@
+# ============================================================
+# CHASIDE • Reporte por carrera (vectorizado)
+# ============================================================
+# Las estadísticas de la carrera (vector de referencia Verde, top-5 Verde
+# y Amarillo por Score, conteos por categoría) se calculan UNA vez; las
+# filas del reporte salen de operaciones de columna completas.
+
+import numpy as np
+import pandas as pd
+
+from .constants import AREAS, CAT_INT_TO_UI, SUGERIDAS_POR_AREA
+
+REF_COLS = [f'TOTAL_{a}' for a in AREAS]
+VERDE_UI = CAT_INT_TO_UI['Verde']
+AMARILLO_UI = CAT_INT_TO_UI['Amarillo']
+
+# máscara de 7 bits (una por área) → letras separadas por coma
+_LETRAS = np.array([", ".join(a for k, a in enumerate(AREAS) if m >> k & 1)
+                    for m in range(1 << len(AREAS))], dtype=object)
+_SUG_STR = {a: ", ".join(SUGERIDAS_POR_AREA.get(a, [])) for a in AREAS}
+_BITS = 1 << np.arange(len(AREAS))
+
+
+def career_context(d_carr: pd.DataFrame, col_nom: str) -> dict:
+    """Estadísticas de la carrera compartidas por todos sus reportes."""
+    cat = d_carr['Categoría_UI']
+    verde = d_carr[cat == VERDE_UI]
+    amar = d_carr[cat == AMARILLO_UI]
+    ref_df = verde[REF_COLS] if not verde.empty else d_carr[REF_COLS]
+    return {
+        'total': len(d_carr),
+        'ref_vec': ref_df.mean().astype(float),
+        'conteo_cat': cat.value_counts(),
+        'top_verde': set(verde.sort_values('Score', ascending=False).head(5)[col_nom].astype(str)),
+        'top_amar': set(amar.sort_values('Score', ascending=True).head(5)[col_nom].astype(str)),
+    }
+
+
+def career_report(d_carr: pd.DataFrame, carrera: str, col_nom: str,
+                  filas: pd.DataFrame = None, ctx: dict = None) -> pd.DataFrame:
+    """Reporte (una fila por estudiante) de la carrera; `filas` limita el
+    reporte a un subconjunto de d_carr (p. ej. un solo estudiante)."""
+    ctx = career_context(d_carr, col_nom) if ctx is None else ctx
+    sub = d_carr if filas is None else filas
+    total = ctx['total']
+
+    diffs = sub[REF_COLS].to_numpy(dtype=float) - ctx['ref_vec'].to_numpy()
+    fort = _LETRAS[(diffs > 0) @ _BITS]
+    opp = _LETRAS[(diffs < 0) @ _BITS]
+
+    cat = sub['Categoría_UI']
+    n_cat = cat.map(ctx['conteo_cat']).astype(float).fillna(0).astype(int).to_numpy()
+    pct = np.round(n_cat / total * 100, 1) if total else np.zeros(len(sub))
+
+    nombres = sub[col_nom].astype(str)
+    ind = np.where(nombres.isin(ctx['top_amar']), "Alumno en riesgo de reprobar",
+          np.where(nombres.isin(ctx['top_verde']), "Joven promesa", "Alumno regular"))
+
+    area = sub['Area_Fuerte_Ponderada'].astype(str)
+    return pd.DataFrame({
+        "Nombre": nombres.to_numpy(),
+        "Carrera": carrera,
+        "Categoría": cat.astype(object).to_numpy(),
+        "N en categoría (carrera)": n_cat,
+        "% en categoría (carrera)": pct,
+        "Indicador": ind,
+        "Área fuerte CHASIDE": area.to_numpy(),
+        "Carreras afines (CHASIDE)": area.map(_SUG_STR).fillna("").to_numpy(),
+        "Fortalezas (letras)": fort,
+        "Áreas de oportunidad (letras)": opp,
+    })
@@ -0,0 +1,79 @@
+# ============================================================
+# CHASIDE • Motor de puntajes por área (sin Streamlit)
+# ============================================================
+# Todas las sumas por área salen de UN producto matricial:
+#   items (N×98, 0/1)  @  W_AREAS (98×14: 7 intereses + 7 aptitudes)
+# Las matrices ítem→área se construyen una sola vez al importar.
+
+import numpy as np
+import pandas as pd
+
+from .constants import (AREAS, APTITUDES_ITEMS, INTERESES_ITEMS, N_ITEMS,
+                        PESO_APTITUD, PESO_INTERES)
+
+
+def _matriz_items(items_por_area: dict) -> np.ndarray:
+    """Matriz indicadora 98×7: W[i, j] = 1 si el ítem i+1 pertenece al área j."""
+    w = np.zeros((N_ITEMS, len(AREAS)), dtype=np.float32)
+    for j, a in enumerate(AREAS):
+        w[np.asarray(items_por_area[a]) - 1, j] = 1
+    return w
+
+W_INTERES = _matriz_items(INTERESES_ITEMS)
+W_APTITUD = _matriz_items(APTITUDES_ITEMS)
+W_AREAS = np.hstack([W_INTERES, W_APTITUD])   # 98×14
+
+COLS_INTERES = [f'INTERES_{a}' for a in AREAS]
+COLS_APTITUD = [f'APTITUD_{a}' for a in AREAS]
+COLS_PUNTAJE = [f'PUNTAJE_COMBINADO_{a}' for a in AREAS]
+COLS_TOTAL = [f'TOTAL_{a}' for a in AREAS]
+
+
+def sumas_por_area(items: np.ndarray):
+    """(N×98 uint8) → (interés N×7 uint8, aptitud N×7 uint8)."""
+    # ⚡ float32 para usar BLAS; las sumas (≤10) son exactas
+    s = (np.asarray(items, dtype=np.float32) @ W_AREAS).astype(np.uint8)
+    k = len(AREAS)
+    return s[:, :k], s[:, k:]
+
+
+def puntajes_combinados(interes: np.ndarray, aptitud: np.ndarray,
+                        peso_i: float = PESO_INTERES, peso_a: float = PESO_APTITUD) -> np.ndarray:
+    return (interes*peso_i + aptitud*peso_a).astype(np.float32)
+
+
+def coincidencia(items: np.ndarray) -> np.ndarray:
+    """Proporción de la respuesta mayoritaria (Sí o No): detecta sesgo de respuesta."""
+    pct_si = np.asarray(items).sum(axis=1, dtype=np.int64) / items.shape[1]
+    return np.maximum(pct_si, 1 - pct_si).astype(np.float32)
+
+
+def area_fuerte(punt: np.ndarray, index=None) -> pd.Series:
+    """Área con mayor puntaje combinado (primer máximo), como category."""
+    idx = punt.argmax(axis=1)
+    cat = pd.Categorical.from_codes(idx, categories=AREAS)
+    # mismas categorías que antes: solo las presentes, en orden alfabético
+    presentes = cat.remove_unused_categories().categories
+    return pd.Series(cat.set_categories(sorted(presentes)), index=index)
+
+
+def score_sums(interes: np.ndarray, aptitud: np.ndarray, index=None,
+               peso_i: float = PESO_INTERES, peso_a: float = PESO_APTITUD) -> pd.DataFrame:
+    """Bloque derivado completo a partir de las sumas por área (N×7 uint8):
+    INTERES_*, APTITUD_*, PUNTAJE_COMBINADO_*, Area_Fuerte_Ponderada, Score y
+    TOTAL_* (mismo orden de columnas que el pipeline)."""
+    punt = puntajes_combinados(interes, aptitud, peso_i, peso_a)
+    total = interes.astype(np.uint16) + aptitud
+
+    # ⚡ un solo DataFrame con todo el bloque (sin inserciones columna a columna)
+    cols = {}
+    for j, a in enumerate(AREAS):
+        cols[COLS_INTERES[j]] = interes[:, j]
+        cols[COLS_APTITUD[j]] = aptitud[:, j]
+    for j in range(len(AREAS)):
+        cols[COLS_PUNTAJE[j]] = punt[:, j]
+    cols['Area_Fuerte_Ponderada'] = area_fuerte(punt, index=index)
+    cols['Score'] = punt.max(axis=1)
+    for j in range(len(AREAS)):
+        cols[COLS_TOTAL[j]] = total[:, j]
+    return pd.DataFrame(cols, index=index)
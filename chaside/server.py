@@ -0,0 +1,263 @@
+# ============================================================
+# CHASIDE • Servicio local de calificación (HTTP/JSON)
+# ============================================================
+# Califica un envío o un lote con las mismas reglas y campos que
+# process_chaside, sin Streamlit ni recarga de la hoja. Las tablas de
+# clasificación (área × carrera) se precargan al arrancar; las peticiones
+# individuales concurrentes se agrupan en micro-lotes (a lo sumo `espera`
+# segundos o `max_lote` envíos) y se califican con una sola llamada
+# vectorizada.
+#
+#   python -m chaside.server --port 8765
+#   POST /score   {"respuestas": [98 × "Sí"/"No"/1/0], "carrera": "...", "nombre": "..."}
+#                 [envío, envío, …]  o  {"envios": [...]}   → lista de resultados
+#   GET  /health
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from .classify import FILA_RECHAZO, lookup_tables
+from .constants import (AREAS, CAT_UI_ORDER, COL_CAR, COL_NOM, N_ITEMS, PERFIL_CARRERAS,
+                        SUGERIDAS_POR_AREA, SUGERIDAS_POR_AREA_STR, UMBRAL_COINCIDENCIA)
+from .normalize import INVALIDO, TOKENS_NO, TOKENS_SI, token_value
+from .pipeline import SCORING_VERSION
+from .scoring import (COLS_APTITUD, COLS_INTERES, COLS_PUNTAJE, COLS_TOTAL, coincidencia,
+                      puntajes_combinados, sumas_por_area)
+
+MAX_LOTE = 256
+ESPERA_S = 0.002
+MAX_BYTES = 8 * 2**20
+MAX_TOKENS = 4096                # grafías recordadas por _valor; no crece con lo que envíen
+
+
+class SubmissionScorer:
+    """Calificación vectorizada de envíos sueltos con tablas precargadas."""
+
+    def __init__(self, carreras=None):
+        self._tokens = {t: token_value(t) for t in TOKENS_SI | TOKENS_NO}
+        self._preparar(list(PERFIL_CARRERAS) if carreras is None else list(carreras))
+
+    def _preparar(self, carreras):
+        # Tablas fijas desde el arranque: las carreras del catálogo, una columna
+        # "sin perfil" por cada nombre que, sin espacios, decide la carrera
+        # mejor perfilada (el catálogo y las sugeridas), y al final "sin
+        # carrera" (None), que es también la de cualquier otro nombre.
+        self._carreras = list(dict.fromkeys(carreras))
+        variantes = sorted({c.strip() for c in self._carreras}
+                           | {c for v in SUGERIDAS_POR_AREA.values() for c in v}
+                           | set(SUGERIDAS_POR_AREA_STR.values()))
+        self._col = {c: j for j, c in enumerate(self._carreras)}
+        self._variante = {c: len(self._carreras) + k for k, c in enumerate(variantes)}
+        # ' ' + nombre: no está en los perfiles pero coincide al recortarlo
+        self._tab = lookup_tables(self._carreras + [' ' + c for c in variantes] + [None])
+        self._sin = len(self._carreras) + len(variantes)
+
+    def _columnas(self, carreras) -> np.ndarray:
+        col, variante, sin = self._col, self._variante, self._sin
+        return np.array([sin if c is None else col.get(c, variante.get(c.strip(), sin))
+                         for c in carreras], dtype=np.intp)
+
+    def _valor(self, token) -> int:
+        if token is None:
+            return 0
+        try:
+            return self._tokens[token]
+        except (KeyError, TypeError):
+            v = token_value(token)
+            if isinstance(token, (str, int, float, bool)) and len(self._tokens) < MAX_TOKENS:
+                self._tokens[token] = v
+            return v
+
+    def items(self, envios) -> tuple:
+        """Respuestas → (matriz uint8 N×98, conteo de tokens no reconocidos por envío)."""
+        items = np.zeros((len(envios), N_ITEMS), dtype=np.uint8)
+        invalidos = [0] * len(envios)
+        for i, e in enumerate(envios):
+            fila = [self._valor(t) for t in e['respuestas']]
+            malos = fila.count(INVALIDO)
+            if malos:
+                invalidos[i] = malos
+                fila = [0 if v == INVALIDO else v for v in fila]
+            items[i] = fila
+        return items, invalidos
+
+    def score(self, envios) -> list:
+        """Lista de envíos validados → lista de resultados (mismos campos que process_chaside)."""
+        items, invalidos = self.items(envios)
+        coinc = coincidencia(items)
+        interes, aptitud = sumas_por_area(items)
+        punt = puntajes_combinados(interes, aptitud)
+        area_idx = punt.argmax(axis=1)
+        score = punt.max(axis=1)
+        total = interes.astype(np.uint16) + aptitud
+        car = self._columnas([e.get('carrera') for e in envios])
+        tab = self._tab
+        fila = np.where(coinc >= UMBRAL_COINCIDENCIA, FILA_RECHAZO, area_idx)
+        coh, mejor = tab['coh'][area_idx, car], tab['mejor'][fila, car]
+        diag, sem, ui = tab['diag'][fila, car], tab['sem'][fila, car], tab['ui'][fila, car]
+
+        interes_l, aptitud_l = interes.tolist(), aptitud.tolist()
+        punt_l, total_l = np.round(punt.astype(np.float64), 6).tolist(), total.tolist()
+        out = []
+        for i, e in enumerate(envios):
+            r = {COL_NOM: e.get('nombre'), COL_CAR: e.get('carrera'),
+                 'Coincidencia': round(float(coinc[i]), 6)}
+            for j in range(len(AREAS)):
+                r[COLS_INTERES[j]] = interes_l[i][j]
+                r[COLS_APTITUD[j]] = aptitud_l[i][j]
+            r.update(zip(COLS_PUNTAJE, punt_l[i]))
+            r['Area_Fuerte_Ponderada'] = AREAS[area_idx[i]]
+            r['Score'] = round(float(score[i]), 6)
+            r.update(zip(COLS_TOTAL, total_l[i]))
+            r['Coincidencia_Ponderada'] = coh[i]
+            r['Carrera_Mejor_Perfilada'] = mejor[i]
+            r['Diagnóstico Primario Vocacional'] = diag[i]
+            r['Semáforo Vocacional'] = sem[i]
+            r['Categoría_UI'] = CAT_UI_ORDER[ui[i]] if ui[i] >= 0 else None
+            if invalidos[i]:
+                r['respuestas_invalidas'] = invalidos[i]
+            out.append(r)
+        return out
+
+
+def validate(envio) -> dict:
+    """Forma mínima de un envío; ValueError con un mensaje para el cliente."""
+    if not isinstance(envio, dict):
+        raise ValueError('cada envío debe ser un objeto JSON')
+    resp = envio.get('respuestas')
+    if not isinstance(resp, list) or len(resp) != N_ITEMS:
+        raise ValueError(f"'respuestas' debe ser una lista de {N_ITEMS} valores")
+    for campo in ('carrera', 'nombre'):
+        if envio.get(campo) is not None and not isinstance(envio[campo], str):
+            raise ValueError(f"'{campo}' debe ser texto")
+    return envio
+
+
+class MicroBatcher:
+    """Agrupa envíos individuales concurrentes en llamadas vectorizadas a `fn`."""
+
+    def __init__(self, fn, max_lote: int = MAX_LOTE, espera: float = ESPERA_S):
+        self.fn, self.max_lote, self.espera = fn, max_lote, espera
+        self.lotes = self.envios = 0
+        self._cola = queue.Queue()
+        threading.Thread(target=self._bucle, name='chaside-microlote', daemon=True).start()
+
+    def submit(self, envio) -> Future:
+        fut = Future()
+        self._cola.put((envio, fut))
+        return fut
+
+    def _bucle(self):
+        while True:
+            lote = [self._cola.get()]
+            limite = time.monotonic() + self.espera
+            while len(lote) < self.max_lote:
+                resto = limite - time.monotonic()
+                try:
+                    lote.append(self._cola.get(timeout=resto) if resto > 0 else self._cola.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                resultados = self.fn([e for e, _ in lote])
+            except Exception as ex:          # no deja colgado a ningún cliente
+                for _, fut in lote:
+                    fut.set_exception(ex)
+                continue
+            self.lotes += 1
+            self.envios += len(lote)
+            for (_, fut), r in zip(lote, resultados):
+                fut.set_result(r)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'chaside/' + SCORING_VERSION
+    protocol_version = 'HTTP/1.1'
+
+    def _json(self, codigo: int, cuerpo):
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def do_GET(self):
+        if self.path != '/health':
+            return self._json(404, {'error': 'no encontrado'})
+        b = self.server.batcher
+        self._json(200, {'ok': True, 'version': SCORING_VERSION, 'lotes': b.lotes, 'envios': b.envios,
+                         'carreras': len(self.server.scorer._carreras)})
+
+    def do_POST(self):
+        if self.path != '/score':
+            return self._json(404, {'error': 'no encontrado'})
+        try:
+            n = int(self.headers.get('Content-Length', 0))
+            if n > MAX_BYTES:
+                return self._json(413, {'error': 'cuerpo demasiado grande'})
+            cuerpo = json.loads(self.rfile.read(n) or b'null')
+            if isinstance(cuerpo, dict) and 'envios' in cuerpo:
+                cuerpo = cuerpo['envios']
+            if isinstance(cuerpo, list):
+                # ⚡ un lote ya viene agrupado: una sola llamada vectorizada
+                return self._json(200, self.server.scorer.score([validate(e) for e in cuerpo]))
+            envio = validate(cuerpo)
+        except (ValueError, TypeError) as e:
+            return self._json(400, {'error': str(e)})
+        except Exception as e:             # error interno: el cliente recibe respuesta igual
+            return self._json(500, {'error': f'{type(e).__name__}: {e}'})
+        # ⚡ envío individual: se suma al micro-lote en curso
+        try:
+            self._json(200, self.server.batcher.submit(envio).result())
+        except Exception as e:
+            self._json(500, {'error': f'{type(e).__name__}: {e}'})
+
+    def log_message(self, formato, *args):   # sin una línea por petición en stderr
+        pass
+
+
+class _Servidor(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128        # ráfagas de envíos simultáneos sin rechazar conexiones
+
+
+def make_server(host: str = '127.0.0.1', port: int = 8765,
+                max_lote: int = MAX_LOTE, espera: float = ESPERA_S) -> ThreadingHTTPServer:
+    """Servidor listo para serve_forever(); tablas precargadas y micro-lotes activos."""
+    srv = _Servidor((host, port), _Handler)
+    srv.scorer = SubmissionScorer()
+    srv.batcher = MicroBatcher(srv.scorer.score, max_lote, espera)
+    return srv
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog='python -m chaside.server',
+                                 description='Servicio local de calificación CHASIDE (HTTP/JSON).')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8765)
+    ap.add_argument('--max-lote', type=int, default=MAX_LOTE, help=f'envíos por micro-lote (default: {MAX_LOTE})')
+    ap.add_argument('--espera-ms', type=float, default=ESPERA_S * 1000,
+                    help=f'espera máxima para completar un micro-lote (default: {ESPERA_S * 1000:g} ms)')
+    args = ap.parse_args(argv)
+
+    srv = make_server(args.host, args.port, args.max_lote, args.espera_ms / 1000)
+    print(f"✔ CHASIDE {SCORING_VERSION} escuchando en http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+# ============================================================
+# CHASIDE • Varias hojas de respuestas (cohortes / planteles)
+# ============================================================
+# Cada fuente es una URL o ruta local con su etiqueta. Se descargan,
+# parsean y califican en paralelo (hilos: la descarga es E/S y el parseo
+# y la calificación pasan casi todo el tiempo en C/numpy sin el GIL), con
+# paralelismo acotado y un plazo global: una fuente lenta o caída se
+# reporta como error y no bloquea a las demás. Los resultados se combinan
+# en un solo frame con la columna COL_FUENTE.
+
+import hashlib
+import math
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .constants import COL_FUENTE
+from .io import TIMEOUT_S
+from .pipeline import merge_invalid, restore_categoricals
+
+MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class Source:
+    label: str
+    url: str
+
+
+def parse_sources(texto: str) -> list:
+    """Una fuente por línea: 'etiqueta | URL o ruta' (sin etiqueta: 'Fuente N').
+    Las líneas vacías o que empiezan con '#' se ignoran."""
+    fuentes = []
+    for linea in texto.splitlines():
+        linea = linea.strip()
+        if not linea or linea.startswith('#'):
+            continue
+        label, sep, url = linea.partition('|')
+        if not sep:
+            label, url = f'Fuente {len(fuentes) + 1}', linea
+        fuentes.append(Source(label.strip(), url.strip()))
+    return fuentes
+
+
+def load_sources(fuentes, load, max_workers: int = MAX_WORKERS, timeout: float = TIMEOUT_S):
+    """Aplica `load(url)` a cada fuente de forma concurrente.
+
+    Devuelve ([(Source, resultado)] en el orden de entrada, {etiqueta: error}).
+    `timeout` es el plazo por fuente; el plazo global escala con el número de
+    tandas que impone `max_workers`.
+    """
+    if not fuentes:
+        return [], {}
+    workers = max(1, min(max_workers, len(fuentes)))
+    plazo = timeout * math.ceil(len(fuentes) / workers)
+    ex = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='chaside-fuente')
+    futuros = {ex.submit(load, f.url): f for f in fuentes}
+    try:
+        _, pendientes = wait(futuros, timeout=plazo)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+    ok, errores = [], {}
+    for fut, f in futuros.items():
+        if fut in pendientes:
+            errores[f.label] = TimeoutError(f'sin respuesta en {plazo:.0f} s')
+        elif fut.exception() is not None:
+            errores[f.label] = fut.exception()
+        else:
+            ok.append((f, fut.result()))
+    return ok, errores
+
+
+def combined_version(partes) -> str:
+    """Versión del frame combinado a partir de (etiqueta, versión) de cada parte."""
+    firma = '\n'.join(f'{f.label}={ds.version}' for f, ds in partes)
+    return 'multi-' + hashlib.blake2b(firma.encode(), digest_size=8).hexdigest()
+
+
+def merge_frames(partes) -> pd.DataFrame:
+    """[(Source, df procesado)] → un frame con COL_FUENTE (categórica, en orden de entrada)."""
+    etiquetas = pd.Index(dict.fromkeys(f.label for f, _ in partes))
+    codigos = etiquetas.get_indexer([f.label for f, _ in partes])
+    df = pd.concat([d for _, d in partes], ignore_index=True)
+    df[COL_FUENTE] = pd.Categorical.from_codes(
+        codigos.repeat([len(d) for _, d in partes]), categories=etiquetas)
+    restore_categoricals(df)
+    df.attrs = {'respuestas_invalidas': merge_invalid(d.attrs.get('respuestas_invalidas', {})
+                                                      for _, d in partes)}
+    return df
@@ -0,0 +1,100 @@
+# ============================================================
+# CHASIDE • Generador de respuestas sintéticas
+# ============================================================
+# Produce exportaciones con el mismo formato que espera process_chaside:
+# 5 columnas de metadatos, 98 ítems, carrera y nombre. Cada estudiante
+# tiene una o dos áreas afines (sesgadas hacia las de su carrera), las
+# respuestas usan grafías variadas de Sí/No y una fracción configurable
+# responde con patrón sesgado (todo Sí / todo No).
+#
+#   python -m chaside.synthetic -n 100000 -o respuestas.csv
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from .constants import AREAS, COL_CAR, COL_NOM, N_ITEMS, PERFIL_CARRERAS
+from .scoring import W_APTITUD, W_INTERES
+
+META_COLS = ['Marca temporal', 'Dirección de correo electrónico', 'Edad', 'Sexo', 'Bachillerato de procedencia']
+ITEM_COLS = [f'{i}. Ítem {i}' for i in range(1, N_ITEMS + 1)]
+
+GRAFIAS_SI = np.array(['Sí', 'Si', 'sí', 'SI', 'si', ' Sí ', 'S', 'x'], dtype=object)
+GRAFIAS_NO = np.array(['No', 'NO', 'no', ' No', 'N', '0'], dtype=object)
+P_SI = np.array([.55, .15, .1, .08, .05, .03, .02, .02])
+P_NO = np.array([.6, .15, .12, .06, .04, .03])
+
+_AREA_ITEM = (W_INTERES + W_APTITUD).argmax(axis=1)       # área de cada ítem (98,)
+_CARRERAS = list(PERFIL_CARRERAS)
+_FUERTES = [[AREAS.index(a) for a in PERFIL_CARRERAS[c]['Fuerte']] for c in _CARRERAS]
+_BACHS = np.array(['CBTIS', 'Bachillerato General', 'CONALEP', 'Preparatoria UdeC', 'CETMAR'], dtype=object)
+
+
+def generate_answers(n: int, seed: int = 0, sesgo: float = 0.05, afinidad: float = 0.6,
+                     inicio: int = 0, vacias: float = 0.002) -> pd.DataFrame:
+    """DataFrame crudo de n estudiantes.
+
+    sesgo: fracción con patrón todo-Sí/todo-No; afinidad: probabilidad de que
+    el área fuerte del estudiante sea una de las de su carrera; vacias:
+    fracción de celdas sin responder; inicio: desplazamiento de folios.
+    """
+    rng = np.random.default_rng(seed)
+    car_idx = rng.integers(0, len(_CARRERAS), n)
+
+    # área afín: de la carrera con prob. `afinidad`, si no, cualquiera
+    afin = rng.integers(0, len(AREAS), n)
+    de_carrera = rng.random(n) < afinidad
+    for k, fuertes in enumerate(_FUERTES):
+        m = de_carrera & (car_idx == k)
+        afin[m] = np.asarray(fuertes)[rng.integers(0, len(fuertes), m.sum())]
+
+    base = rng.uniform(0.3, 0.5, (n, 1))
+    p = np.where(_AREA_ITEM[None, :] == afin[:, None], base + 0.4, base)
+    si = rng.random((n, N_ITEMS)) < p
+
+    sesgados = rng.random(n) < sesgo
+    si[sesgados] = (rng.random(sesgados.sum()) < 0.5)[:, None]
+
+    items = np.where(si, GRAFIAS_SI[rng.choice(len(GRAFIAS_SI), (n, N_ITEMS), p=P_SI)],
+                         GRAFIAS_NO[rng.choice(len(GRAFIAS_NO), (n, N_ITEMS), p=P_NO)])
+    if vacias:
+        items[rng.random((n, N_ITEMS)) < vacias] = None
+
+    folio = np.arange(inicio, inicio + n)
+    meta = {
+        META_COLS[0]: (pd.Timestamp('2025-02-01 08:00') + pd.to_timedelta(folio * 37, unit='s')).astype(str),
+        META_COLS[1]: pd.Series(folio).map('alumno{:07d}@correo.mx'.format),
+        META_COLS[2]: rng.integers(17, 23, n),
+        META_COLS[3]: np.where(rng.random(n) < 0.5, 'Mujer', 'Hombre'),
+        META_COLS[4]: _BACHS[rng.integers(0, len(_BACHS), n)],
+    }
+    df = pd.concat([pd.DataFrame(meta), pd.DataFrame(items, columns=ITEM_COLS)], axis=1)
+    df[COL_CAR] = np.asarray(_CARRERAS, dtype=object)[car_idx]
+    df[COL_NOM] = pd.Series(folio).map('Estudiante {:07d}'.format)
+    return df
+
+
+def write_csv(path: str, n: int, seed: int = 0, chunk: int = 100_000, **kw) -> str:
+    """Escribe n estudiantes en bloques (memoria acotada aun para millones)."""
+    with open(path, 'w', encoding='utf-8', newline='') as fh:
+        for k, ini in enumerate(range(0, n, chunk)):
+            m = min(chunk, n - ini)
+            generate_answers(m, seed=seed + k, inicio=ini, **kw).to_csv(fh, header=(k == 0), index=False)
+    return path
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog='python -m chaside.synthetic',
+                                 description='Genera respuestas CHASIDE sintéticas (CSV).')
+    ap.add_argument('-n', type=int, required=True, help='número de estudiantes')
+    ap.add_argument('-o', '--salida', required=True, help='archivo CSV de salida')
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--sesgo', type=float, default=0.05, help='fracción con patrón sesgado (default: 0.05)')
+    args = ap.parse_args(argv)
+    write_csv(args.salida, args.n, seed=args.seed, sesgo=args.sesgo)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
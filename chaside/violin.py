@@ -0,0 +1,104 @@
+# ============================================================
+# CHASIDE • Resumen de violines en el servidor
+# ============================================================
+# En lugar de mandar cada Score al navegador, se calculan por (carrera,
+# categoría) los cuartiles, los bigotes (1.5·IQR, como Plotly) y una KDE
+# gaussiana evaluada en una malla fija. Todo vectorizado: un lexsort para
+# los cuartiles y un binning lineal sobre la malla + convolución con el
+# kernel de cada grupo para la densidad. El resultado pesa O(grupos × malla)
+# sin importar cuántos estudiantes haya.
+#
+#   CHASIDE_VIOLIN_FILAS   filas a partir de las cuales el panel usa el resumen
+
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from . import perf
+
+N_MALLA = 128
+UMBRAL_FILAS = int(os.environ.get('CHASIDE_VIOLIN_FILAS', 20_000))
+_STATS = ['n', 'q1', 'mediana', 'q3', 'bigote_inf', 'bigote_sup', 'min', 'max']
+
+
+@dataclass
+class ViolinSummary:
+    grupos: pd.DataFrame      # carrera, categoría, n, q1, mediana, q3, bigote_inf, bigote_sup, min, max
+    malla: np.ndarray         # (N_MALLA,) valores de la medida
+    densidad: np.ndarray      # grupos × N_MALLA, máximo 1 por grupo (0 más allá de min/max ± 2·bw)
+
+
+def _cuantil(v, inicio, n, q):
+    """Cuantil lineal (el de numpy/Plotly) de cada grupo sobre el arreglo ordenado."""
+    pos = q * (n - 1)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, n - 1)
+    a, b = v[inicio + lo], v[inicio + hi]
+    return a + (b - a) * (pos - lo)
+
+
+@perf.timed('violin_summary')
+def violin_summary(df: pd.DataFrame, col_car: str, col_cat: str, categorias,
+                   medida: str = 'Score', n_malla: int = N_MALLA) -> ViolinSummary:
+    """Resumen por (carrera, categoría) de `medida` para las filas en `categorias`."""
+    cat = pd.Categorical(df[col_cat], categories=list(categorias))
+    car = df[col_car].astype('category').cat
+    v = df[medida].to_numpy(dtype=np.float64)
+    ok = (cat.codes >= 0) & (car.codes.to_numpy() >= 0) & ~np.isnan(v)
+    n_cat = len(categorias)
+    clave = car.codes.to_numpy()[ok].astype(np.int64) * n_cat + cat.codes[ok]
+    v = v[ok]
+
+    if not len(v):
+        return ViolinSummary(pd.DataFrame(columns=[col_car, col_cat, *_STATS]),
+                             np.zeros(n_malla), np.zeros((0, n_malla)))
+
+    orden = np.lexsort((v, clave))
+    clave, v = clave[orden], v[orden]
+    grupos, inicio, n = np.unique(clave, return_index=True, return_counts=True)
+
+    q1, med, q3 = (_cuantil(v, inicio, n, q) for q in (0.25, 0.5, 0.75))
+    iqr = q3 - q1
+    # bigotes: dato más extremo dentro de 1.5·IQR (grupo por grupo con reduceat)
+    g = np.repeat(np.arange(len(grupos)), n)
+    bajo = np.minimum.reduceat(np.where(v >= (q1 - 1.5 * iqr)[g], v, np.inf), inicio)
+    alto = np.maximum.reduceat(np.where(v <= (q3 + 1.5 * iqr)[g], v, -np.inf), inicio)
+    vmin, vmax = v[inicio], v[inicio + n - 1]
+
+    # malla fija: rango global con 10% de margen; binning lineal → conteos por nodo
+    margen = max(v.max() - v.min(), 1.0) * 0.1
+    lo_g = v.min() - margen
+    malla = np.linspace(lo_g, v.max() + margen, n_malla)
+    paso = malla[1] - malla[0]
+    t = (v - lo_g) / paso
+    i0 = np.minimum(np.floor(t).astype(np.int64), n_malla - 2)
+    f = t - i0
+    conteo = (np.bincount(g * n_malla + i0, weights=1 - f, minlength=len(grupos) * n_malla)
+              + np.bincount(g * n_malla + i0 + 1, weights=f, minlength=len(grupos) * n_malla))
+    conteo = conteo.reshape(len(grupos), n_malla)
+
+    # ancho de banda de Silverman por grupo (la regla que usa Plotly)
+    media = np.add.reduceat(v, inicio) / n
+    var = np.add.reduceat((v - media[g]) ** 2, inicio) / np.maximum(n - 1, 1)
+    escala = np.minimum(np.sqrt(var), iqr / 1.349)
+    escala = np.where(escala > 0, escala, np.sqrt(var))
+    bw = 1.059 * np.where(escala > 0, escala, paso) * n.astype(np.float64) ** -0.2
+    bw = np.maximum(bw, paso / 2)
+
+    # densidad = conteos ⊛ kernel gaussiano del grupo (grupos × malla × malla)
+    d = (malla[:, None] - malla[None, :]) / bw[:, None, None]
+    dens = np.einsum('gj,gij->gi', conteo, np.exp(-0.5 * d * d))
+    # extensión 'soft' de Plotly: la curva llega hasta 2 anchos de banda más allá de los datos
+    fuera = ((malla[None, :] < (vmin - 2 * bw)[:, None]) | (malla[None, :] > (vmax + 2 * bw)[:, None]))
+    dens[fuera] = 0
+    pico = dens.max(axis=1, keepdims=True)
+    dens = np.divide(dens, pico, out=np.zeros_like(dens), where=pico > 0)
+
+    tabla = pd.DataFrame({
+        col_car: pd.Categorical.from_codes(grupos // n_cat, categories=car.categories),
+        col_cat: pd.Categorical.from_codes(grupos % n_cat, categories=list(categorias)),
+        **dict(zip(_STATS, (n, q1, med, q3, bajo, alto, vmin, vmax))),
+    })
+    return ViolinSummary(tabla, malla, dens)
@@ -0,0 +1,106 @@
+# ============================================================
+# CHASIDE • Simulación de ponderaciones intereses/aptitudes
+# ============================================================
+# Cambiar los pesos solo mueve PUNTAJE_COMBINADO_*, el área fuerte, el
+# Score y la clasificación: INTERES_*/APTITUD_*, la coincidencia y la
+# carrera no cambian. Reweighter guarda esas matrices y las tablas de
+# clasificación una vez y recalcula lo demás en milisegundos.
+#
+# Para el barrido sobre una malla de pesos, cada par (interés ≤ 10,
+# aptitud ≤ 4) de un área se codifica en un entero 0..54; para cada punto
+# de la malla basta ordenar esos 55 puntajes posibles y el área fuerte es
+# el primer máximo de los rangos (uint8), sin calcular puntajes N × 7 en float.
+
+import numpy as np
+import pandas as pd
+
+from . import perf
+from .classify import FILA_RECHAZO, classify_codes, encode_carreras, lookup_tables
+from .constants import (APTITUDES_ITEMS, CAT_UI_ORDER, COL_CAR, INTERESES_ITEMS,
+                        UMBRAL_COINCIDENCIA)
+from .scoring import COLS_APTITUD, COLS_INTERES, COLS_PUNTAJE, area_fuerte, puntajes_combinados
+
+_MAX_APT = max(len(v) for v in APTITUDES_ITEMS.values())      # 4
+_MAX_INT = max(len(v) for v in INTERESES_ITEMS.values())      # 10
+_N_COD = (_MAX_INT + 1) * (_MAX_APT + 1)
+_BLOQUE_BYTES = 64 * 2**20          # memoria de trabajo por bloque del barrido
+
+
+class Reweighter:
+    def __init__(self, df: pd.DataFrame, col_car: str = COL_CAR):
+        self.index = df.index
+        self.interes = df[COLS_INTERES].to_numpy(np.uint8)
+        self.aptitud = df[COLS_APTITUD].to_numpy(np.uint8)
+        self.rechazo = df['Coincidencia'].to_numpy() >= UMBRAL_COINCIDENCIA
+        self.car_codes, carreras = encode_carreras(df[col_car])
+        self.tab = lookup_tables(carreras)
+        self.ui_base = df['Categoría_UI'].cat.codes.to_numpy()   # -1 = fuera de la UI
+        # barrido: Categoría_UI + 1 por (área, carrera) en una tabla plana; rechazados fijos
+        self._ui_plana = (self.tab['ui'][:FILA_RECHAZO].astype(np.int8) + 1).ravel()
+        self._car32 = self.car_codes.astype(np.int32)
+        self._n_car = self.tab['ui'].shape[1]
+        # un arreglo contiguo por área: 7 gathers de N en vez de un argmax sobre N×7
+        self._codigos = np.ascontiguousarray((self.interes * np.uint8(_MAX_APT + 1) + self.aptitud).T)
+
+    def _argmax_rangos(self, r: np.ndarray) -> np.ndarray:
+        """Área fuerte (primer máximo) para cada fila de rangos r (g × 55)."""
+        mejor = r[:, self._codigos[0]]
+        area = np.zeros(mejor.shape, np.int32)
+        for j in range(1, len(self._codigos)):
+            v = r[:, self._codigos[j]]
+            gana = v > mejor
+            area[gana] = j
+            np.maximum(mejor, v, out=mejor)
+        return area
+
+    def reweight(self, peso_i: float, peso_a: float) -> pd.DataFrame:
+        """PUNTAJE_COMBINADO_*, Area_Fuerte_Ponderada, Score y las columnas de
+        clasificación con otros pesos (mismos tipos que process_chaside)."""
+        with perf.stage('reweight', rows=len(self.index)):
+            punt = puntajes_combinados(self.interes, self.aptitud, peso_i, peso_a)
+            area_idx = punt.argmax(axis=1)
+            fila = np.where(self.rechazo, FILA_RECHAZO, area_idx)
+            cols = {c: punt[:, j] for j, c in enumerate(COLS_PUNTAJE)}
+            cols['Area_Fuerte_Ponderada'] = area_fuerte(punt, index=self.index)
+            cols['Score'] = punt.max(axis=1)
+            clasif = classify_codes(self.tab, fila, area_idx, self.car_codes, self.index)
+            return pd.concat([pd.DataFrame(cols, index=self.index), clasif], axis=1)
+
+    def apply(self, df: pd.DataFrame, peso_i: float, peso_a: float) -> pd.DataFrame:
+        """`df` (el mismo frame del constructor) con las columnas recalculadas en su lugar."""
+        return df.assign(**self.reweight(peso_i, peso_a))
+
+    def sweep(self, pesos_i, pesos_a=None) -> pd.DataFrame:
+        """Para cada punto de la malla: estudiantes que cambian de Categoría_UI
+        respecto al frame original y conteo por categoría.
+
+        Sin `pesos_a` los pares son (p, 1 − p); con `pesos_a` se usa el
+        producto cartesiano de ambas listas."""
+        pi = np.atleast_1d(np.asarray(pesos_i, dtype=np.float64))
+        if pesos_a is None:
+            pa = 1 - pi
+        else:
+            pi, pa = (g.ravel() for g in np.meshgrid(pi, np.asarray(pesos_a, np.float64), indexing='ij'))
+
+        # puntaje de cada código (interés, aptitud) en cada punto → rango denso por punto
+        i_cod, a_cod = np.divmod(np.arange(_N_COD), _MAX_APT + 1)
+        vals = (i_cod[None, :] * pi[:, None] + a_cod[None, :] * pa[:, None]).astype(np.float32)
+        rangos = np.stack([np.unique(v, return_inverse=True)[1] for v in vals]).astype(np.uint8)
+
+        n_ui = len(CAT_UI_ORDER)
+        cambian = np.empty(len(pi), np.int64)
+        conteo = np.empty((len(pi), n_ui + 1), np.int64)
+        bloque = max(1, _BLOQUE_BYTES // max(1, self._codigos.size))
+        with perf.stage('reweight_sweep', rows=len(self.index)):
+            for ini in range(0, len(pi), bloque):
+                r = rangos[ini:ini + bloque]
+                area = self._argmax_rangos(r)                             # g × N
+                ui1 = self._ui_plana[area * self._n_car + self._car32]    # Categoría_UI + 1 (0 = fuera)
+                ui1[:, self.rechazo] = self.tab['ui'][FILA_RECHAZO, self.car_codes[self.rechazo]] + 1
+                cambian[ini:ini + len(r)] = (ui1 != self.ui_base + 1).sum(axis=1)
+                for k, fila in enumerate(ui1):
+                    conteo[ini + k] = np.bincount(fila, minlength=n_ui + 1)
+        out = pd.DataFrame({'peso_interes': pi, 'peso_aptitud': pa, 'cambian': cambian})
+        for k, cat in enumerate(CAT_UI_ORDER):
+            out[cat] = conteo[:, k + 1]
+        return out
@@ -0,0 +1,16 @@
+# ============================================================
+# CHASIDE • Páginas de la app (se importan al abrirlas)
+# ============================================================
+# main.py solo dibuja la barra lateral y enruta. Cada página vive en su
+# módulo y se importa la primera vez que se abre: Presentación y Equipo de
+# trabajo no cargan pandas, plotly ni el pipeline, y nunca tocan el dataset.
+# Las páginas de datos cargan el dataset con `paginas.datos`, que concentra
+# las funciones cacheadas (cache_resource) y el pipeline.
+
+PAGINAS = {
+    "Presentación": "paginas.presentacion",
+    "Información general": "paginas.general",
+    "Información individual": "paginas.individual",
+    "Equipo de trabajo": "paginas.equipo",
+}
+DE_DATOS = {"Información general", "Información individual"}
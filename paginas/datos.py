@@ -0,0 +1,162 @@
+# ============================================================
+# CHASIDE • Carga de datos de la app (cacheada)
+# ============================================================
+# Se importa la primera vez que se abre una página de datos: trae pandas,
+# el pipeline y las cachés compartidas entre sesiones.
+
+import os
+
+import streamlit as st
+
+from chaside import perf, pipeline
+from chaside.cache import DiskCache
+from chaside.constants import PESO_APTITUD, PESO_INTERES
+from chaside.dataset import Dataset, DatasetStore
+from chaside.history import HistoryStore
+from chaside.incremental import IncrementalScorer
+from chaside.io import fetch_bytes, is_columnar, parse_answers, read_answers, sha256
+from chaside.sources import combined_version, load_sources, merge_frames, parse_sources
+from chaside.whatif import Reweighter
+
+def load_csv(url: str) -> bytes:
+    with perf.stage('load_csv'):
+        return fetch_bytes(url)
+
+@st.cache_resource(show_spinner=False, ttl=60)  # modo incremental: re-descarga como máximo cada minuto
+def load_csv_reciente(url: str) -> tuple:
+    # ⚡ (sha256, bytes) una vez por ventana: sin copia ni hash por rerun; el
+    # calificador incremental solo parsea cuando cambia el sha256
+    with perf.stage('load_csv'):
+        crudo = fetch_bytes(url)
+    return sha256(crudo), crudo
+
+@st.cache_resource(show_spinner=False)  # ⚡ caché de disco compartida; precarga al abrir la 1ª página de datos
+def disk_cache() -> DiskCache:
+    cache = DiskCache()
+    cache.warm_start()
+    return cache
+
+@st.cache_resource(show_spinner=False)  # ⚡ un dataset inmutable por versión, común a todas las sesiones
+def dataset_store() -> DatasetStore:
+    return DatasetStore()
+
+def process_chaside(crudo: bytes) -> Dataset:
+    # ⚡ versión = sha256(archivo crudo) + versión de calificación; la misma hoja
+    # bajo dos URLs comparte un único dataset en memoria
+    return build_dataset(sha256(crudo), lambda: parse_answers(crudo))
+
+def build_dataset(digest: str, leer) -> Dataset:
+    disk = disk_cache()
+    key = disk.key(digest)
+
+    def _construir():
+        # ⚡ caché persistente: sobrevive reinicios y réplicas
+        df = disk.get(key)
+        if df is None:
+            df, _, _ = pipeline.process_chaside(leer())
+            disk.put(key, df)
+        # ⚡ Dataset arma el cubo carrera × categoría × medida y el índice de estudiantes
+        return Dataset(df, key)
+
+    return dataset_store().get(key, _construir)
+
+def firma_local(url: str):
+    """Ruta + tamaño + fecha de modificación de un archivo local; None para URLs."""
+    if not os.path.exists(url):
+        return None
+    info = os.stat(url)
+    return f'{os.path.abspath(url)}:{info.st_size}:{info.st_mtime_ns}'
+
+def load_dataset(url: str) -> Dataset:
+    # la firma entra en la clave de la caché: un archivo local editado se vuelve a cargar
+    return _load_dataset(url, firma_local(url))
+
+@st.cache_resource(show_spinner=False, max_entries=32)  # ⚡ (URL, firma) → dataset compartido (sin copias por sesión)
+def _load_dataset(url: str, firma: str) -> Dataset:
+    if firma is not None and is_columnar(url):
+        # ⚡ Parquet/Arrow local: mapeado a memoria y proyectado, sin leerlo a bytes;
+        # versión barata = la firma del archivo
+        return build_dataset(sha256(firma.encode()), lambda: read_answers(url))
+    return process_chaside(load_csv(url))
+
+def load_fuentes(fuentes: list):
+    # ⚡ descarga, parseo y calificación en paralelo; cada fuente queda cacheada
+    # por URL (load_dataset) y una caída solo se reporta, no detiene a las demás
+    partes, errores = load_sources(fuentes, load_dataset)
+    if not partes:
+        return None, errores
+    version = combined_version(partes)
+    ds = dataset_store().get(version, lambda: merge_frames([(f, d.df) for f, d in partes]))
+    return ds, errores
+
+@st.cache_resource(show_spinner=False)  # histórico particionado por cohorte y carrera
+def history_store() -> HistoryStore:
+    return HistoryStore()
+
+def load_cohorte(anio: int) -> Dataset:
+    # ⚡ solo se leen las particiones de esa cohorte; versión = firma de sus archivos
+    hist = history_store()
+    return dataset_store().get(hist.version([anio]), lambda: hist.cohort(anio))
+
+def reweighted(ds: Dataset, peso_i: float, peso_a: float) -> Dataset:
+    # ⚡ reutiliza INTERES_*/APTITUD_* del dataset: solo se recalculan puntajes,
+    # área fuerte, Score y semáforos; el índice de estudiantes no cambia
+    rw = ds.derived('reweighter', lambda: Reweighter(ds.df, ds.col_car))
+    version = f"{ds.version}-w{peso_i:.2f}-{peso_a:.2f}"
+    return dataset_store().get(version, lambda: Dataset(
+        rw.apply(ds.df, peso_i, peso_a), version, index=ds.index, col_car=ds.col_car, col_nom=ds.col_nom))
+
+@st.cache_resource(show_spinner=False)  # ⚡ un calificador incremental por URL, compartido entre sesiones
+def incremental_scorer(url: str) -> IncrementalScorer:
+    return IncrementalScorer()
+
+def cargar(url: str, incremental: bool, fuentes_texto: str = "", cohorte: int = None,
+           pesos: tuple = None):
+    """(ds, base) para la página de datos; None si no se pudo cargar (el error ya se mostró).
+    `base` es el dataset con la ponderación vigente cuando se simulan otros pesos."""
+    # arranque en caliente: la primera página de datos del proceso precarga los
+    # últimos datasets del disco (main.py no lo hace para no importar pandas al arrancar)
+    disk_cache()
+    fuentes = parse_sources(fuentes_texto)
+
+    # Procesamiento cacheado (⚡)
+    try:
+        if cohorte is not None:
+            ds = load_cohorte(cohorte)
+            st.sidebar.caption(f"🗂️ Cohorte {cohorte} · {len(ds)} filas (histórico)")
+        elif fuentes:
+            ds, errores = load_fuentes(fuentes)
+            for etiqueta, e in errores.items():
+                st.sidebar.warning(f"⚠️ {etiqueta}: {e}")
+            if ds is None:
+                raise RuntimeError("ninguna fuente respondió")
+            st.sidebar.caption(f"📚 {len(fuentes) - len(errores)} de {len(fuentes)} fuentes · {len(ds)} filas")
+        elif incremental:
+            scorer = incremental_scorer(url)
+            digest, crudo = load_csv_reciente(url)
+            ds = scorer.update_raw(crudo, digest)
+            st.sidebar.caption(f"🔄 {scorer.n_scored} de {len(ds)} filas calificadas en la última actualización")
+        else:
+            ds = load_dataset(url)
+    except Exception as e:
+        st.error(f"❌ No fue posible cargar/procesar el archivo: {e}")
+        return None
+
+    if cohorte is None and st.sidebar.button(
+            "📦 Guardar en el histórico",
+            help="Guarda los resultados particionados por cohorte (año de la marca temporal) y carrera."):
+        try:
+            guardadas = history_store().write(ds.df)
+            st.sidebar.success(f"Cohortes guardadas: {', '.join(map(str, guardadas))}")
+        except Exception as e:
+            st.sidebar.warning(f"⚠️ No se pudo guardar en el histórico: {e}")
+
+    invalidos = ds.attrs.get('respuestas_invalidas', {})
+    if invalidos:
+        st.sidebar.warning(f"⚠️ {sum(invalidos.values())} respuestas no reconocidas se contaron como 'No': "
+                           + ", ".join(f"'{t}' ({n})" for t, n in list(invalidos.items())[:5]))
+
+    base = ds
+    if pesos is not None and pesos != (PESO_INTERES, PESO_APTITUD):
+        ds = reweighted(ds, *pesos)
+    return ds, base
@@ -0,0 +1,21 @@
+# ============================================================
+# CHASIDE • Equipo de trabajo (página estática)
+# ============================================================
+
+import streamlit as st
+
+from chaside import perf
+
+@perf.timed('render_equipo')
+def render_equipo():
+    st.markdown('<div class="h1-title">Equipo de trabajo</div>', unsafe_allow_html=True)
+    st.markdown("""
+Este proyecto fue elaborado por el siguiente equipo interdisciplinario:
+
+- **Dra. Elena Elsa Bricio Barrios** – AÑADIR SEMBLANZA  
+- **Dr. Santiago Arceo-Díaz** – AÑADIR SEMBLANZA  
+- **Psic. Martha Cecilia Ramírez Guzmán** – AÑADIR SEMBLANZA
+""")
+    st.caption("Tecnológico Nacional de México – Instituto Tecnológico de Colima")
+
+render = render_equipo
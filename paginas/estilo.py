@@ -0,0 +1,13 @@
+# ============================================================
+# CHASIDE • Colores de la UI (sin dependencias)
+# ============================================================
+
+PRIMARY = "#0F766E"; ACCENT="#14B8A6"; SLATE="#475569"
+GREEN="#22c55e"; AMBER="#f59e0b"; RED="#ef4444"; GRAY="#6b7280"; BLUE="#3b82f6"
+
+CAT_UI_COLORS = {
+    "Perfil congruente con la carrera seleccionada": GREEN,
+    "Perfil incongruente al seleccionado": AMBER,
+    "Perfil no definido": RED,
+    "Respuestas no válidas (sesgo de respuesta)": GRAY,
+}
@@ -0,0 +1,178 @@
+# ============================================================
+# CHASIDE • Información general (gráficas de toda la población)
+# ============================================================
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from chaside import perf
+from chaside.constants import (AREAS, CAT_INT_TO_UI, CAT_UI_ORDER, DESC_CHASIDE, PESO_APTITUD,
+                               PESO_INTERES)
+from chaside.dataset import Dataset
+from chaside.violin import UMBRAL_FILAS, ViolinSummary, violin_summary
+from chaside.whatif import Reweighter
+
+from .estilo import CAT_UI_COLORS, PRIMARY
+
+@perf.timed('render_info_general')
+def render_info_general(ds: Dataset):
+    col_car, cube = ds.col_car, ds.cube
+    st.markdown('<div class="h1-title">Información general</div>', unsafe_allow_html=True)
+    st.caption("Resumen global por categoría, carrera y comparativas Verde vs Amarillo.")
+
+    # Pastel (solo %)
+    st.subheader("🥧 Distribución general por categoría")
+    with perf.stage('agg_pie'):
+        resumen = ds.derived('pie', cube.pie)  # ⚡ memorizado por versión del dataset
+    fig_pie = px.pie(
+        resumen, names='Categoría_UI', values='N', hole=0.35,
+        color='Categoría_UI', color_discrete_map=CAT_UI_COLORS,
+        title="Distribución general por categoría"
+    )
+    fig_pie.update_traces(textposition='inside', texttemplate='%{percent:.1%}')
+    fig_pie.update_layout(legend_title_text="Categoría")
+    st.plotly_chart(fig_pie, use_container_width=True)
+
+    # Barras apiladas
+    st.subheader("🏫 Distribución por carrera y categoría")
+    modo = st.radio("Modo de visualización", ["Proporción (100% apilado)", "Valores absolutos"], horizontal=True, index=0)
+    with perf.stage('agg_stacked'):
+        stacked = ds.derived('stacked', cube.stacked, col_car, modo == "Proporción (100% apilado)")  # ⚡
+
+    if modo == "Proporción (100% apilado)":
+        fig = px.bar(stacked, x=col_car, y='%', color='Categoría_UI',
+                     category_orders={'Categoría_UI': CAT_UI_ORDER},
+                     color_discrete_map=CAT_UI_COLORS, barmode='stack',
+                     text=stacked['%'].round(1).astype(str)+'%',
+                     title="Proporción (%) por carrera")
+        fig.update_layout(yaxis_title="Proporción (%)", xaxis_title="Carrera", xaxis_tickangle=-30)
+    else:
+        fig = px.bar(stacked, x=col_car, y='N', color='Categoría_UI',
+                     category_orders={'Categoría_UI': CAT_UI_ORDER},
+                     color_discrete_map=CAT_UI_COLORS, barmode='stack',
+                     text='N', title="Número de estudiantes por carrera")
+        fig.update_layout(yaxis_title="Número de estudiantes", xaxis_title="Carrera", xaxis_tickangle=-30)
+        fig.update_traces(textposition='inside')
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Violín Verde vs Amarillo
+    st.subheader("🎻 Distribución de puntajes (Violin) – Verde vs Amarillo por carrera")
+    verde_ui = CAT_INT_TO_UI['Verde']; amarillo_ui = CAT_INT_TO_UI['Amarillo']
+    cats = cube.carreras_con([verde_ui, amarillo_ui])  # ⚡ sin filtrar el frame
+    if not cats:
+        st.info("No hay estudiantes en categorías Verde o Amarillo para graficar.")
+    else:
+        n_va = int(resumen.loc[resumen['Categoría_UI'].isin([verde_ui, amarillo_ui]), 'N'].sum())
+        if n_va > UMBRAL_FILAS:
+            # ⚡ cuartiles + KDE calculados en el servidor: la figura no lleva cada Score
+            res = ds.derived('violin_resumen', lambda: violin_summary(
+                ds.df, col_car, 'Categoría_UI', (verde_ui, amarillo_ui)))
+            fig_v = fig_violin_resumen(res, col_car, cats, [verde_ui, amarillo_ui],
+                                       "Distribución de Score por carrera (Verde vs Amarillo)")
+            st.caption(f"Resumen calculado en el servidor para {n_va} estudiantes "
+                       "(cuartiles, bigotes a 1.5·IQR y densidad estimada).")
+        else:
+            df = ds.df
+            df_violin = ds.derived('violin_va', lambda: df[df['Categoría_UI'].isin([verde_ui, amarillo_ui])])
+            fig_v = px.violin(df_violin, x=col_car, y="Score", color="Categoría_UI",
+                              box=True, points=False, color_discrete_map=CAT_UI_COLORS,
+                              category_orders={"Categoría_UI":[verde_ui,amarillo_ui]},
+                              title="Distribución de Score por carrera (Verde vs Amarillo)")
+        # líneas punteadas
+        for i in range(len(cats)-1):
+            fig_v.add_vline(x=i+0.5, line_width=1, line_dash="dot", line_color="gray")
+        fig_v.update_layout(xaxis_title="Carrera", yaxis_title="Score (máximo ponderado CHASIDE)",
+                            xaxis_tickangle=-30, legend_title_text="Categoría")
+        st.plotly_chart(fig_v, use_container_width=True)
+
+    # Radar Verde vs Amarillo
+    st.subheader("🕸️ Radar CHASIDE – Comparación Verde vs Amarillo por carrera")
+    carreras = sorted(cube.carreras_presentes())
+    if not carreras:
+        st.info("No hay carreras para mostrar en el radar.")
+        return
+    carrera_sel = st.selectbox("Elige una carrera para comparar:", carreras)
+    n_va = cube.count(carrera_sel, [verde_ui, amarillo_ui])  # ⚡ O(1) desde el cubo
+
+    if (n_va == 0).any():
+        st.warning("No hay datos suficientes de Verde y Amarillo en esta carrera.")
+    else:
+        tot_cols = [f'TOTAL_{a}' for a in AREAS]
+        prom = cube.mean(carrera_sel, [verde_ui, amarillo_ui], tot_cols)
+        prom_ren = prom.rename(columns={f'TOTAL_{a}':a for a in AREAS}).reset_index()
+        fig_r = px.line_polar(prom_ren.melt(id_vars='Categoría_UI', value_vars=AREAS,
+                                            var_name='Área', value_name='Promedio'),
+                              r='Promedio', theta='Área', color='Categoría_UI',
+                              line_close=True, markers=True, color_discrete_map=CAT_UI_COLORS,
+                              category_orders={'Categoría_UI':[verde_ui,amarillo_ui]},
+                              title=f"Perfil CHASIDE – {carrera_sel} (Verde vs Amarillo)")
+        fig_r.update_traces(fill='toself', opacity=0.75)
+        st.plotly_chart(fig_r, use_container_width=True)
+
+        diffs = (prom.loc[verde_ui] - prom.loc[amarillo_ui])
+        diffs.index = [i.replace("TOTAL_","") for i in diffs.index]
+        top3 = diffs.sort_values(ascending=False).head(3)
+        st.markdown("**Áreas a reforzar (donde *Amarillo* está más bajo):**")
+        for letra, delta in top3.items():
+            st.markdown(f"- **{letra}** (Δ = {delta:.2f}) — {DESC_CHASIDE[letra]}")
+
+def fig_violin_resumen(res: ViolinSummary, col_car: str, carreras: list, categorias: list, titulo: str):
+    """Violines agrupados dibujados desde el resumen: un polígono por grupo
+    (densidad en la malla) y una caja con los cuartiles precalculados."""
+    fig = go.Figure()
+    pos = {c: i for i, c in enumerate(carreras)}
+    ancho = 0.8 / len(categorias)
+    g = res.grupos
+    for j, cat in enumerate(categorias):
+        filas = np.flatnonzero((g['Categoría_UI'] == cat).to_numpy())
+        if not len(filas):
+            continue
+        centros = np.array([pos[c] for c in g[col_car].iloc[filas]]) + (j - (len(categorias) - 1) / 2) * ancho
+        xs, ys = [], []
+        for c, f in zip(centros, filas):
+            m = res.densidad[f] > 0
+            medio = res.densidad[f][m] * ancho * 0.48
+            y = res.malla[m].round(3)
+            xs += [*(c - medio).round(3), *(c + medio)[::-1].round(3), None]
+            ys += [*y, *y[::-1], None]
+        color = CAT_UI_COLORS[cat]
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', fill='toself', name=cat, legendgroup=cat,
+                                 line=dict(color=color, width=1), opacity=0.6, hoverinfo='skip'))
+        est = g.iloc[filas]
+        fig.add_trace(go.Box(x=centros, q1=est['q1'], median=est['mediana'], q3=est['q3'],
+                             lowerfence=est['bigote_inf'], upperfence=est['bigote_sup'],
+                             width=ancho * 0.2, name=cat, legendgroup=cat, showlegend=False,
+                             marker_color=color, boxpoints=False))
+    fig.update_layout(title=titulo, xaxis=dict(tickmode='array', tickvals=list(range(len(carreras))),
+                                               ticktext=carreras, range=[-0.5, len(carreras) - 0.5]))
+    return fig
+
+@perf.timed('render_simulacion')
+def render_simulacion(base: Dataset, ds: Dataset, peso_i: float, peso_a: float):
+    st.markdown('<div class="section-title">⚖️ Simulación de ponderación</div>', unsafe_allow_html=True)
+    cambian = int((ds.df['Categoría_UI'].cat.codes != base.df['Categoría_UI'].cat.codes).sum())
+    c1, c2 = st.columns([1, 2.4])
+    with c1:
+        st.metric(f"Cambian de categoría con {peso_i:.2f}/{peso_a:.2f}", f"{cambian}",
+                  help=f"Respecto a la ponderación vigente ({PESO_INTERES}/{PESO_APTITUD}).")
+        comp = base.cube.pie().rename(columns={'N': 'Vigente'})
+        comp['Simulada'] = ds.cube.pie()['N']
+        st.dataframe(comp, hide_index=True, use_container_width=True)
+    with c2:
+        # ⚡ barrido vectorizado de pesos, memorizado por versión del dataset
+        rw = base.derived('reweighter', lambda: Reweighter(base.df, base.col_car))
+        barrido = base.derived('barrido_pesos', lambda: rw.sweep(np.round(np.arange(0, 1.0001, 0.05), 2)))
+        fig_s = px.line(barrido, x='peso_interes', y='cambian', markers=True,
+                        title="Estudiantes que cambian de categoría según el peso de intereses")
+        fig_s.add_vline(x=peso_i, line_dash="dot", line_color=PRIMARY)
+        fig_s.update_layout(xaxis_title="Peso de intereses (aptitudes = 1 − peso)",
+                            yaxis_title="Estudiantes que cambian")
+        st.plotly_chart(fig_s, use_container_width=True)
+    st.divider()
+
+def render(ds: Dataset, base: Dataset = None, pesos: tuple = None):
+    if pesos is not None:
+        render_simulacion(base, ds, *pesos)
+    render_info_general(ds)
@@ -0,0 +1,154 @@
+# ============================================================
+# CHASIDE • Información individual (reporte por estudiante)
+# ============================================================
+
+import io
+
+import streamlit as st
+
+from chaside import perf
+from chaside.constants import AREAS, DESC_CHASIDE, PERFIL_CARRERAS, SUGERIDAS_POR_AREA
+from chaside.dataset import Dataset
+from chaside.html_report import write_reports
+from chaside.report import career_context, career_report
+
+from .estilo import AMBER, BLUE, GREEN, SLATE
+
+MAX_OPCIONES = 50   # máximo de nombres en el selector de estudiante
+WORKERS_ZIP = 2     # procesos por descarga de reportes: el servidor se comparte entre sesiones
+
+@perf.timed('render_info_individual')
+def render_info_individual(ds: Dataset):
+    df, col_nom, index = ds.df, ds.col_nom, ds.index  # vista de solo lectura del dataset compartido
+    st.markdown('<div class="h1-title">Información particular del estudiantado</div>', unsafe_allow_html=True)
+    st.caption("Reporte ejecutivo individual con indicadores y recomendaciones.")
+
+    carreras = index.carreras  # ⚡ índice persistente
+    if not carreras:
+        st.warning("No hay carreras disponibles en el archivo."); return
+    carrera_sel = st.selectbox("Carrera a evaluar:", carreras, index=0)
+
+    filas = index.rows(carrera_sel)
+    if not len(filas):
+        st.warning("No hay estudiantes para esta carrera."); return
+    d_carr = df.iloc[filas]
+
+    # ⚡ buscador: solo se envían al navegador las primeras coincidencias
+    consulta = st.text_input("Buscar estudiante (nombre o parte del nombre):", "")
+    nombres, n_coinc = index.search(carrera_sel, consulta, limite=MAX_OPCIONES)
+    if not nombres:
+        st.warning("Ningún estudiante coincide con la búsqueda."); return
+    if n_coinc > len(nombres):
+        st.caption(f"Mostrando {len(nombres)} de {n_coinc} coincidencias; escribe más para acotar.")
+    est_sel = st.selectbox("Estudiante:", nombres, index=0)
+
+    pos = index.row_of(carrera_sel, est_sel)
+    if pos is None:
+        st.warning("No se encontró el estudiante seleccionado."); return
+    alumno = df.iloc[[pos]]
+    al = alumno.iloc[0]
+
+    cat_ui = al['Categoría_UI']
+    total_carr = len(d_carr)
+    n_cat = int((d_carr['Categoría_UI']==cat_ui).sum())
+    pct_cat = (n_cat/total_carr*100) if total_carr else 0.0
+
+    # ⚡ estadísticas de la carrera una sola vez (referencia Verde, top-5, conteos)
+    ctx = ds.derived('career_context', lambda c: career_context(df.iloc[index.rows(c)], col_nom), carrera_sel)
+    data_ind = career_report(d_carr, carrera_sel, col_nom, filas=alumno.iloc[[0]], ctx=ctx)
+    indicador = data_ind['Indicador'].iat[0]
+
+    # referencia: promedio Verde de la carrera; si no hay, promedio de la carrera
+    ref_cols = [f'TOTAL_{a}' for a in AREAS]
+    ref_vec = ctx['ref_vec']
+    al_vec  = alumno[ref_cols].iloc[0].astype(float)
+    diff    = (al_vec - ref_vec)
+    fortalezas   = diff[diff>0].sort_values(ascending=False)
+    oportunidades= diff[diff<0].abs().sort_values(ascending=False)
+
+    # KPIs
+    st.markdown("## 🧾 Reporte ejecutivo individual")
+    c1,c2,c3,c4 = st.columns([2.2,2,2.6,2])
+    with c1: st.markdown(f"<div class='card kpi'><b>Nombre del estudiante</b><br>{est_sel}</div>", unsafe_allow_html=True)
+    with c2: st.markdown(f"<div class='card kpi'><b>Carrera</b><br>{carrera_sel}</div>", unsafe_allow_html=True)
+    with c3: st.markdown(f"<div class='card kpi'><b>Categoría identificada</b><br><span style='font-weight:700;color:{BLUE}'>{cat_ui}</span></div>", unsafe_allow_html=True)
+    with c4: st.markdown(f"<div class='card kpi'><b>Nº en esta categoría</b><br>{n_cat} (<span style='font-weight:700'>{pct_cat:.1f}%</span>)</div>", unsafe_allow_html=True)
+    badge_color = {"Joven promesa": GREEN, "Alumno en riesgo de reprobar": AMBER}.get(indicador, SLATE)
+    st.markdown(f"<span class='badge' style='background:rgba(20,184,166,.12);color:{badge_color}'>Indicador: {indicador}</span>", unsafe_allow_html=True)
+    st.divider()
+
+    st.markdown("### ✅ Fortalezas destacadas")
+    if fortalezas.empty:
+        st.info("No se observan dimensiones por encima del promedio de referencia del grupo.")
+    else:
+        st.markdown("<ul class='list-tight'>", unsafe_allow_html=True)
+        for letra_full, delta in fortalezas.items():
+            k = str(letra_full).replace("TOTAL_","")
+            st.markdown(f"<li><b>{k}</b> (+{delta:.2f}) — {DESC_CHASIDE[k]}</li>", unsafe_allow_html=True)
+        st.markdown("</ul>", unsafe_allow_html=True)
+
+    st.markdown("### 🛠️ Áreas de oportunidad")
+    if oportunidades.empty:
+        st.info("El estudiante no presenta brechas importantes respecto al grupo.")
+    else:
+        st.markdown("<ul class='list-tight'>", unsafe_allow_html=True)
+        for letra_full, gap in oportunidades.items():
+            k = str(letra_full).replace("TOTAL_","")
+            st.markdown(f"<li><b>{k}</b> (−{gap:.2f}) — {DESC_CHASIDE[k]}</li>", unsafe_allow_html=True)
+        st.markdown("</ul>", unsafe_allow_html=True)
+
+    st.divider()
+
+    # Coherencia + afinidades
+    st.markdown("### 🎯 Coherencia vocacional y afinidades")
+    area_fuerte = str(al['Area_Fuerte_Ponderada'])
+    perfil_sel = PERFIL_CARRERAS.get(carrera_sel, {})
+    if area_fuerte in set(perfil_sel.get('Fuerte', [])): coh_text="Coherente"
+    elif area_fuerte in set(perfil_sel.get('Baja', [])): coh_text="Requiere orientación"
+    else: coh_text="Neutral"
+    sugeridas = SUGERIDAS_POR_AREA.get(area_fuerte, [])
+    st.write(f"- **Área fuerte (CHASIDE):** {area_fuerte}")
+    st.write(f"- **Evaluación de coherencia con la carrera elegida:** {coh_text}")
+    st.markdown("### 📚 Carreras con mayor afinidad al perfil (según CHASIDE)")
+    if sugeridas:
+        st.markdown("<ul class='list-tight'>", unsafe_allow_html=True)
+        for c in sugeridas: st.markdown(f"<li>{c}</li>", unsafe_allow_html=True)
+        st.markdown("</ul>", unsafe_allow_html=True)
+    else:
+        st.info("No se identificaron carreras afines basadas en el área fuerte.")
+
+    # Descargas (CSV)
+    col_a, col_b = st.columns([1.2, 1])
+    with col_a:
+        st.download_button("⬇️ Descargar reporte individual (CSV)",
+                           data=data_ind.to_csv(index=False).encode("utf-8"),
+                           file_name=f"reporte_individual_{est_sel}.csv",
+                           mime="text/csv", use_container_width=True)
+    with col_b:
+        # ⚡ el reporte de la carrera se genera solo al pulsar el botón (callable)
+        st.download_button("⬇️ Descargar reporte de la carrera (CSV)",
+                           data=lambda: career_report(d_carr, carrera_sel, col_nom, ctx=ctx)
+                                        .to_csv(index=False).encode("utf-8"),
+                           file_name=f"reporte_carrera_{carrera_sel}.csv",
+                           mime="text/csv", use_container_width=True)
+
+    # ⚡ reportes HTML en lote: se generan al pulsar, en un pool de procesos
+    col_c, col_d = st.columns([1.2, 1])
+    with col_c:
+        st.download_button("📦 Reportes HTML de la carrera (zip)",
+                           data=lambda: zip_reportes(ds, [carrera_sel]),
+                           file_name=f"reportes_{carrera_sel}.zip",
+                           mime="application/zip", use_container_width=True)
+    with col_d:
+        st.download_button("📦 Reportes HTML de todas las carreras (zip)",
+                           data=lambda: zip_reportes(ds),
+                           file_name="reportes_chaside.zip",
+                           mime="application/zip", use_container_width=True)
+
+def zip_reportes(ds: Dataset, carreras: list = None) -> bytes:
+    buf = io.BytesIO()
+    write_reports(ds.df, buf, carreras, ds.col_car, ds.col_nom, workers=WORKERS_ZIP)
+    return buf.getvalue()
+
+def render(ds: Dataset, base: Dataset = None, pesos: tuple = None):
+    render_info_individual(ds)
@@ -0,0 +1,38 @@
+# ============================================================
+# CHASIDE • Presentación (página estática)
+# ============================================================
+
+import streamlit as st
+
+from chaside import perf
+
+@perf.timed('render_presentacion')
+def render_presentacion():
+    st.markdown('<div class="h1-title">Diagnóstico Vocacional – Escala CHASIDE</div>', unsafe_allow_html=True)
+    st.markdown('<div class="subtitle">Aplicación de apoyo a la elección de carrera universitaria</div>', unsafe_allow_html=True)
+    with st.container():
+        st.markdown('<div class="section-title">Autores e institución</div>', unsafe_allow_html=True)
+        col1, col2 = st.columns([2, 1.2])
+        with col1:
+            st.markdown("""
+<div class="card">
+<b>Autores</b><br>
+• Dra. Elena Elsa Bricio Barrios<br>
+• Dr. Santiago Arceo-Díaz<br>
+• Psic. Martha Cecilia Ramírez Guzmán
+</div>""", unsafe_allow_html=True)
+        with col2:
+            st.markdown("""
+<div class="card">
+<b>Institución</b><br>
+Tecnológico Nacional de México<br>
+Instituto Tecnológico de Colima
+</div>""", unsafe_allow_html=True)
+    st.markdown('<div class="section-title">¿Qué pretende esta aplicación?</div>', unsafe_allow_html=True)
+    st.markdown("""
+<div class="card">
+Herramienta para alinear intereses y aptitudes con la elección de carrera,
+usando la escala CHASIDE y visualizaciones claras para estudiantes, familias y docentes.
+</div>""", unsafe_allow_html=True)
+
+render = render_presentacion
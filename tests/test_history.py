@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from chaside.constants import COL_COHORTE, COL_FUENTE, COL_NOM
+from chaside.history import HistoryStore
+from chaside.pipeline import process_chaside
+from chaside.sources import Source, merge_frames
+from chaside.synthetic import generate_answers
+
+
+def _cohorte(n, anio, seed):
+    raw = generate_answers(n, seed=seed)
+    raw.iloc[:, 0] = f'01/02/{anio} 08:00:00'
+    return process_chaside(raw)[0]
+
+
+def test_cohortes_con_columnas_distintas(tmp_path):
+    hist = HistoryStore(str(tmp_path))
+    hist.write(_cohorte(40, 2024, seed=1))                       # una sola fuente: sin Fuente
+    multi = merge_frames([(Source('A', 'a.csv'), _cohorte(30, 2025, seed=2)),
+                          (Source('B', 'b.csv'), _cohorte(20, 2025, seed=3))])
+    hist.write(multi)
+
+    c2025 = hist.cohort(2025)
+    assert COL_FUENTE in c2025.columns
+    assert c2025[COL_FUENTE].value_counts().to_dict() == {'A': 30, 'B': 20}
+
+    c2024 = hist.cohort(2024)
+    assert len(c2024) == 40
+    assert COL_FUENTE not in c2024.columns or c2024[COL_FUENTE].isna().all()
+
+    todo = hist.query(columns=[COL_NOM, COL_FUENTE])
+    assert len(todo) == 90
+    assert todo.loc[todo[COL_COHORTE] == 2025, COL_FUENTE].notna().all()
+    assert todo.loc[todo[COL_COHORTE] == 2024, COL_FUENTE].isna().all()
+
+
+def test_consulta_sin_particiones_que_coincidan(tmp_path):
+    hist = HistoryStore(str(tmp_path))
+    hist.write(_cohorte(10, 2024, seed=1))
+    assert hist.query(columns=[COL_NOM], years=[1999]).empty